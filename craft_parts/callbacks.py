@@ -82,12 +82,10 @@ def register_post_step(func: StepCallback, *, step_list: List[Step] = None) -> N
 def clear() -> None:
     """Clear all existing registered callback functions."""
 
-    global _PROLOGUE_HOOKS, _EPILOGUE_HOOKS  # pylint: disable=global-statement
-    global _PRE_STEP_HOOKS, _POST_STEP_HOOKS  # pylint: disable=global-statement
-    _PROLOGUE_HOOKS = []
-    _EPILOGUE_HOOKS = []
-    _PRE_STEP_HOOKS = []
-    _POST_STEP_HOOKS = []
+    _PROLOGUE_HOOKS.clear()
+    _EPILOGUE_HOOKS.clear()
+    _PRE_STEP_HOOKS.clear()
+    _POST_STEP_HOOKS.clear()
 
 
 def run_prologue(project_info: ProjectInfo, *, part_list=List[Part]) -> None:
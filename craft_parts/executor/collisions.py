@@ -18,10 +18,12 @@
 
 import filecmp
 import os
-from typing import Any, Dict, List
+import stat
+from typing import Any, Dict, List, Optional
 
 from craft_parts import errors
 from craft_parts.parts import Part
+from craft_parts.utils import file_utils
 
 from . import filesets
 from .filesets import Fileset
@@ -35,6 +37,9 @@ def check_for_stage_collisions(part_list: List[Part]) -> None:
     """
 
     all_parts_files: Dict[str, Dict[str, Any]] = {}
+    # A file shared by many parts is compared against each previous part,
+    # so hash each file once instead of comparing contents pairwise.
+    digests: Dict[str, str] = {}
     for part in part_list:
         stage_files = part.spec.stage_fileset
         if not stage_files:
@@ -58,7 +63,7 @@ def check_for_stage_collisions(part_list: List[Part]) -> None:
                 this = os.path.join(part.part_install_dir, f)
                 other = os.path.join(all_parts_files[other_part_name]["installdir"], f)
 
-                if paths_collide(this, other):
+                if paths_collide(this, other, digests=digests):
                     conflict_files.append(f)
 
             if conflict_files:
@@ -75,15 +80,29 @@ def check_for_stage_collisions(part_list: List[Part]) -> None:
         }
 
 
-def paths_collide(path1: str, path2: str) -> bool:
-    """Check whether the provided paths conflict to each other."""
-    if not (os.path.lexists(path1) and os.path.lexists(path2)):
+def paths_collide(
+    path1: str, path2: str, *, digests: Optional[Dict[str, str]] = None
+) -> bool:
+    """Check whether the provided paths conflict to each other.
+
+    :param path1: The first path to compare.
+    :param path2: The second path to compare.
+    :param digests: A cache of file content hashes indexed by path. If not
+        specified, file contents are compared directly.
+    """
+    # A single lstat per path provides existence, symlink and directory
+    # information. Directory checks only matter when neither path is a
+    # symlink, in which case lstat and stat results are the same.
+    try:
+        mode1 = os.lstat(path1).st_mode
+        mode2 = os.lstat(path2).st_mode
+    except OSError:
         return False
 
-    path1_is_dir = os.path.isdir(path1)
-    path2_is_dir = os.path.isdir(path2)
-    path1_is_link = os.path.islink(path1)
-    path2_is_link = os.path.islink(path2)
+    path1_is_dir = stat.S_ISDIR(mode1)
+    path2_is_dir = stat.S_ISDIR(mode2)
+    path1_is_link = stat.S_ISLNK(mode1)
+    path2_is_link = stat.S_ISLNK(mode2)
 
     # Paths collide if they're both symlinks, but pointing to different places
     if path1_is_link and path2_is_link:
@@ -98,17 +117,28 @@ def paths_collide(path1: str, path2: str) -> bool:
         return True
 
     # Paths collide if neither path is a directory, and the files have
-    # different contents
-    if not (path1_is_dir and path2_is_dir) and _file_collides(path1, path2):
+    # different contents. Only regular files can be hashed.
+    if not (stat.S_ISREG(mode1) and stat.S_ISREG(mode2)):
+        digests = None
+
+    if not (path1_is_dir and path2_is_dir) and _file_collides(path1, path2, digests):
         return True
 
     # Otherwise, paths do not conflict
     return False
 
 
-def _file_collides(file_this: str, file_other: str) -> bool:
+def _file_collides(
+    file_this: str, file_other: str, digests: Optional[Dict[str, str]] = None
+) -> bool:
     if not file_this.endswith(".pc"):
-        return not filecmp.cmp(file_this, file_other, shallow=False)
+        if digests is None:
+            return not filecmp.cmp(file_this, file_other, shallow=False)
+
+        if os.path.getsize(file_this) != os.path.getsize(file_other):
+            return True
+
+        return _file_digest(file_this, digests) != _file_digest(file_other, digests)
 
     # pkgconfig files need special handling
     pc_file_1 = open(file_this)
@@ -127,3 +157,11 @@ def _file_collides(file_this: str, file_other: str) -> bool:
         pc_file_1.close()
         pc_file_2.close()
     return False
+
+
+def _file_digest(path: str, digests: Dict[str, str]) -> str:
+    digest = digests.get(path)
+    if digest is None:
+        digest = file_utils.calculate_hash(path, algorithm="sha1")
+        digests[path] = digest
+    return digest
@@ -18,10 +18,11 @@
 
 from __future__ import annotations
 
+import copy
 import logging
 import platform
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
 
 from craft_parts import errors, utils
 from craft_parts.dirs import ProjectDirs
@@ -64,11 +65,24 @@ class ProjectInfo:
         else:
             self._local_plugins_dir = Path(local_plugins_dir)
 
+        # project options don't change after the target machine is set
+        self._project_options: Dict[str, Any] = {
+            "application_name": self._application_name,
+            "arch_triplet": self.arch_triplet,
+            "target_arch": self.target_arch,
+        }
+
     def __getattr__(self, name):
         if hasattr(self._dirs, name):
             return getattr(self._dirs, name)
 
-        return self._custom_args[name]
+        if name in self._custom_args:
+            return self._custom_args[name]
+
+        raise AttributeError(f"{self.__class__.__name__!r} has no attribute {name!r}")
+
+    def __deepcopy__(self, memo) -> "ProjectInfo":
+        return _deepcopy_info(self, memo)
 
     @property
     def custom_args(self) -> List[str]:
@@ -83,7 +97,7 @@ class ProjectInfo:
     @property
     def arch_triplet(self) -> str:
         """The machine-vendor-os platform triplet definition."""
-        return self.__machine_info["triplet"]
+        return self.__machine_info.triplet
 
     @property
     def is_cross_compiling(self) -> bool:
@@ -103,7 +117,7 @@ class ProjectInfo:
     @property
     def target_arch(self) -> str:
         """The architecture used for deb packages."""
-        return self.__machine_info["deb"]
+        return self.__machine_info.deb
 
     @property
     def dirs(self) -> ProjectDirs:
@@ -112,11 +126,7 @@ class ProjectInfo:
     @property
     def project_options(self) -> Dict[str, Any]:
         """Obtain a project-wide options dictionary."""
-        return {
-            "application_name": self.application_name,
-            "arch_triplet": self.arch_triplet,
-            "target_arch": self.target_arch,
-        }
+        return self._project_options.copy()
 
     def _set_machine(self, target_arch):
         self.__platform_arch = _get_platform_architecture()
@@ -187,10 +197,15 @@ class PartInfo:
     def __getattr__(self, name):
         return getattr(self._project_info, name)
 
+    def __deepcopy__(self, memo) -> "PartInfo":
+        return _deepcopy_info(self, memo)
+
 
 class StepInfo:
     """Step-level information containing project, part, and step fields."""
 
+    __slots__ = ("_part_info", "step")
+
     def __init__(
         self,
         part_info: PartInfo,
@@ -202,80 +217,127 @@ class StepInfo:
     def __getattr__(self, name):
         return getattr(self._part_info, name)
 
+    def __copy__(self) -> "StepInfo":
+        # The part information is shared, only the step can be changed in
+        # the new object. Create it directly instead of going through the
+        # generic copy protocol, which is also confused by __getattr__.
+        new_info = StepInfo.__new__(StepInfo)
+        new_info._part_info = self._part_info
+        new_info.step = self.step
+        return new_info
+
+    def __deepcopy__(self, memo) -> "StepInfo":
+        new_info = StepInfo.__new__(StepInfo)
+        memo[id(self)] = new_info
+        new_info._part_info = copy.deepcopy(self._part_info, memo)
+        new_info.step = self.step
+        return new_info
+
+
+class _ArchInfo(NamedTuple):
+    """Architecture-specific values for a target machine."""
+
+    kernel: str
+    deb: str
+    uts_machine: str
+    triplet: str
+    core_dynamic_linker: Optional[str] = None
+    cross_compiler_prefix: Optional[str] = None
+    cross_build_packages: Tuple[str, ...] = ()
+
+
+# Values of these types are immutable and can be shared between copies.
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None), Path, _ArchInfo)
+
+
+def _deepcopy_info(obj: Any, memo: Dict[int, Any]) -> Any:
+    """Deep copy an information object, sharing its immutable attributes.
+
+    The object is created directly instead of being reconstructed by the
+    generic copy protocol, which doesn't work with attribute delegation
+    through __getattr__.
+    """
+    new_obj = obj.__class__.__new__(obj.__class__)
+    memo[id(obj)] = new_obj
+
+    for key, value in obj.__dict__.items():
+        if not isinstance(value, _IMMUTABLE_TYPES):
+            value = copy.deepcopy(value, memo)
+        new_obj.__dict__[key] = value
+
+    return new_obj
+
 
 def _get_platform_architecture() -> str:
     # TODO: handle Windows architectures
     return platform.machine()
 
 
-_ARCH_TRANSLATIONS = {
-    "aarch64": {
-        "kernel": "arm64",
-        "deb": "arm64",
-        "uts_machine": "aarch64",
-        "cross-compiler-prefix": "aarch64-linux-gnu-",
-        "cross-build-packages": ["gcc-aarch64-linux-gnu", "libc6-dev-arm64-cross"],
-        "triplet": "aarch64-linux-gnu",
-        "core-dynamic-linker": "lib/ld-linux-aarch64.so.1",
-    },
-    "armv7l": {
-        "kernel": "arm",
-        "deb": "armhf",
-        "uts_machine": "arm",
-        "cross-compiler-prefix": "arm-linux-gnueabihf-",
-        "cross-build-packages": ["gcc-arm-linux-gnueabihf", "libc6-dev-armhf-cross"],
-        "triplet": "arm-linux-gnueabihf",
-        "core-dynamic-linker": "lib/ld-linux-armhf.so.3",
-    },
-    "i686": {
-        "kernel": "x86",
-        "deb": "i386",
-        "uts_machine": "i686",
-        "triplet": "i386-linux-gnu",
-    },
-    "ppc": {
-        "kernel": "powerpc",
-        "deb": "powerpc",
-        "uts_machine": "powerpc",
-        "cross-compiler-prefix": "powerpc-linux-gnu-",
-        "cross-build-packages": ["gcc-powerpc-linux-gnu", "libc6-dev-powerpc-cross"],
-        "triplet": "powerpc-linux-gnu",
-    },
-    "ppc64le": {
-        "kernel": "powerpc",
-        "deb": "ppc64el",
-        "uts_machine": "ppc64el",
-        "cross-compiler-prefix": "powerpc64le-linux-gnu-",
-        "cross-build-packages": [
-            "gcc-powerpc64le-linux-gnu",
-            "libc6-dev-ppc64el-cross",
-        ],
-        "triplet": "powerpc64le-linux-gnu",
-        "core-dynamic-linker": "lib64/ld64.so.2",
-    },
-    "riscv64": {
-        "kernel": "riscv64",
-        "deb": "riscv64",
-        "uts_machine": "riscv64",
-        "cross-compiler-prefix": "riscv64-linux-gnu-",
-        "cross-build-packages": ["gcc-riscv64-linux-gnu", "libc6-dev-riscv64-cross"],
-        "triplet": "riscv64-linux-gnu",
-        "core-dynamic-linker": "lib/ld-linux-riscv64-lp64d.so.1",
-    },
-    "s390x": {
-        "kernel": "s390",
-        "deb": "s390x",
-        "uts_machine": "s390x",
-        "cross-compiler-prefix": "s390x-linux-gnu-",
-        "cross-build-packages": ["gcc-s390x-linux-gnu", "libc6-dev-s390x-cross"],
-        "triplet": "s390x-linux-gnu",
-        "core-dynamic-linker": "lib/ld64.so.1",
-    },
-    "x86_64": {
-        "kernel": "x86",
-        "deb": "amd64",
-        "uts_machine": "x86_64",
-        "triplet": "x86_64-linux-gnu",
-        "core-dynamic-linker": "lib64/ld-linux-x86-64.so.2",
-    },
+_ARCH_TRANSLATIONS: Dict[str, _ArchInfo] = {
+    "aarch64": _ArchInfo(
+        kernel="arm64",
+        deb="arm64",
+        uts_machine="aarch64",
+        triplet="aarch64-linux-gnu",
+        core_dynamic_linker="lib/ld-linux-aarch64.so.1",
+        cross_compiler_prefix="aarch64-linux-gnu-",
+        cross_build_packages=("gcc-aarch64-linux-gnu", "libc6-dev-arm64-cross"),
+    ),
+    "armv7l": _ArchInfo(
+        kernel="arm",
+        deb="armhf",
+        uts_machine="arm",
+        triplet="arm-linux-gnueabihf",
+        core_dynamic_linker="lib/ld-linux-armhf.so.3",
+        cross_compiler_prefix="arm-linux-gnueabihf-",
+        cross_build_packages=("gcc-arm-linux-gnueabihf", "libc6-dev-armhf-cross"),
+    ),
+    "i686": _ArchInfo(
+        kernel="x86",
+        deb="i386",
+        uts_machine="i686",
+        triplet="i386-linux-gnu",
+    ),
+    "ppc": _ArchInfo(
+        kernel="powerpc",
+        deb="powerpc",
+        uts_machine="powerpc",
+        triplet="powerpc-linux-gnu",
+        cross_compiler_prefix="powerpc-linux-gnu-",
+        cross_build_packages=("gcc-powerpc-linux-gnu", "libc6-dev-powerpc-cross"),
+    ),
+    "ppc64le": _ArchInfo(
+        kernel="powerpc",
+        deb="ppc64el",
+        uts_machine="ppc64el",
+        triplet="powerpc64le-linux-gnu",
+        core_dynamic_linker="lib64/ld64.so.2",
+        cross_compiler_prefix="powerpc64le-linux-gnu-",
+        cross_build_packages=("gcc-powerpc64le-linux-gnu", "libc6-dev-ppc64el-cross"),
+    ),
+    "riscv64": _ArchInfo(
+        kernel="riscv64",
+        deb="riscv64",
+        uts_machine="riscv64",
+        triplet="riscv64-linux-gnu",
+        core_dynamic_linker="lib/ld-linux-riscv64-lp64d.so.1",
+        cross_compiler_prefix="riscv64-linux-gnu-",
+        cross_build_packages=("gcc-riscv64-linux-gnu", "libc6-dev-riscv64-cross"),
+    ),
+    "s390x": _ArchInfo(
+        kernel="s390",
+        deb="s390x",
+        uts_machine="s390x",
+        triplet="s390x-linux-gnu",
+        core_dynamic_linker="lib/ld64.so.1",
+        cross_compiler_prefix="s390x-linux-gnu-",
+        cross_build_packages=("gcc-s390x-linux-gnu", "libc6-dev-s390x-cross"),
+    ),
+    "x86_64": _ArchInfo(
+        kernel="x86",
+        deb="amd64",
+        uts_machine="x86_64",
+        triplet="x86_64-linux-gnu",
+        core_dynamic_linker="lib64/ld-linux-x86-64.so.2",
+    ),
 }
@@ -22,7 +22,7 @@ import os
 import shutil
 import sys
 from pathlib import Path
-from typing import List, Optional, Set, cast
+from typing import Any, Dict, List, Optional, Set
 
 from craft_parts import errors, packages
 from craft_parts.state_manager import GlobalState, load_global_state
@@ -36,14 +36,17 @@ logger = logging.getLogger(__name__)
 class BasePackagesLayerState(GlobalState):
     """Context data for the base package layer."""
 
-    yaml_tag = "!BasePackageLayerState"
-
     def __init__(self, *, base_packages: Set[str] = None):
         if not base_packages:
             base_packages = set()
 
         self.base_packages = base_packages
 
+    @classmethod
+    def unmarshal(cls, data: Dict[str, Any]) -> "BasePackagesLayerState":
+        """Create and populate a new state object from dictionary data."""
+        return cls(base_packages=set(data.get("base_packages", [])))
+
 
 class BasePackagesLayerStack:
     """The filesystem layers used to modify the base image with base package."""
@@ -95,7 +98,10 @@ class BasePackagesLayerStack:
     def load_state(self) -> Optional[BasePackagesLayerState]:
         """Load the base package installation state."""
         state_data, _ = load_global_state(self._state_file)
-        return cast(BasePackagesLayerState, state_data)
+        if state_data is None:
+            return None
+
+        return BasePackagesLayerState.unmarshal(state_data)
 
     def write_state(self, *, base_packages: List[str]) -> None:
         """Write the base package installation state to disk."""
@@ -23,14 +23,14 @@ of actions (using `--plan-only`) or execute them,
 """
 
 import argparse
+import functools
 import logging
 import sys
 
-import yaml
-
 import craft_parts
 import craft_parts.errors
 from craft_parts import ActionType, Step
+from craft_parts.utils import yaml_utils
 
 
 def main():
@@ -62,7 +62,7 @@ def main():
 
 def _process_parts(options: argparse.Namespace) -> None:
     with open(options.file) as f:
-        part_data = yaml.safe_load(f)
+        part_data = yaml_utils.safe_load(f)
 
     lf = craft_parts.LifecycleManager(
         part_data, application_name="craft-parts", work_dir=options.work_dir
@@ -156,6 +156,11 @@ def _parse_step(name: str) -> Step:
 
 
 def _parse_arguments() -> argparse.Namespace:
+    return _get_parser().parse_args()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
     prog = "python -m craft_parts"
     description = (
         "A command line interface for the craft_parts module to build "
@@ -218,4 +223,4 @@ def _parse_arguments() -> argparse.Namespace:
         "parts", nargs="*", help="The list of parts whose this step should be cleaned"
     )
 
-    return parser.parse_args()
+    return parser
@@ -16,6 +16,7 @@
 
 """Definitions and helpers to handle parts."""
 
+import bisect
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Set
 
@@ -274,7 +275,10 @@ def part_list_by_name(
 
 
 def sort_parts(part_list: List[Part]) -> List[Part]:
-    """Perform an inneficient but easy to follow sorting of parts.
+    """Sort parts by dependencies and then by name.
+
+    Parts are ordered using Kahn's algorithm, building the list from the
+    end: a part is placed once no remaining part depends on it.
 
     :param part_list: The list of parts to sort.
 
@@ -282,30 +286,34 @@ def sort_parts(part_list: List[Part]) -> List[Part]:
 
     :raises PartDependencyCycle: if there are circular dependencies.
     """
-    sorted_parts = []  # type: List[Part]
+    parts_by_name = {part.name: part for part in part_list}
+
+    # Count how many parts depend on each part.
+    dependents = dict.fromkeys(parts_by_name, 0)
+    for part in part_list:
+        for name in set(part.dependencies):
+            if name in dependents:
+                dependents[name] += 1
 
     # We want to process parts in a consistent order between runs. The
     # simplest way to do this is to sort them by name.
-    all_parts = sorted(part_list, key=lambda part: part.name, reverse=True)
-
-    while all_parts:
-        top_part = None
-
-        for part in all_parts:
-            mentioned = False
-            for other in all_parts:
-                if part.name in other.dependencies:
-                    mentioned = True
-                    break
-            if not mentioned:
-                top_part = part
-                break
-        if not top_part:
-            raise errors.PartDependencyCycle()
-
-        sorted_parts = [top_part] + sorted_parts
-        all_parts.remove(top_part)
+    ready = sorted(name for name, count in dependents.items() if count == 0)
+    sorted_parts = []  # type: List[Part]
+
+    while ready:
+        top_part = parts_by_name[ready.pop()]
+        sorted_parts.append(top_part)
+
+        for name in set(top_part.dependencies):
+            if name in dependents:
+                dependents[name] -= 1
+                if dependents[name] == 0:
+                    bisect.insort(ready, name)
+
+    if len(sorted_parts) != len(parts_by_name):
+        raise errors.PartDependencyCycle()
 
+    sorted_parts.reverse()
     return sorted_parts
 
 
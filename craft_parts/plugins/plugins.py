@@ -16,7 +16,6 @@
 
 """Definitions and helpers to handle plugins."""
 
-import copy
 from typing import TYPE_CHECKING, Dict, Type
 
 from craft_parts import errors
@@ -44,7 +43,7 @@ _BUILTIN_PLUGINS: Dict[str, PluginType] = {
     "nil": NilPlugin,
 }
 
-_PLUGINS = copy.deepcopy(_BUILTIN_PLUGINS)
+_PLUGINS = _BUILTIN_PLUGINS.copy()
 
 
 def get_plugin(
@@ -87,4 +86,4 @@ def register(plugins: Dict[str, PluginType]) -> None:
 def unregister_all() -> None:
     """Unregister all user-registered plugins."""
     global _PLUGINS  # pylint: disable=global-statement
-    _PLUGINS = copy.deepcopy(_BUILTIN_PLUGINS)
+    _PLUGINS = _BUILTIN_PLUGINS.copy()
@@ -20,7 +20,7 @@ import contextlib
 import itertools
 import logging
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from craft_parts import errors, parts, sources, steps
 from craft_parts.infos import ProjectInfo
@@ -32,7 +32,6 @@ from craft_parts.steps import Step
 from .dirty_report import Dependency, DirtyReport
 from .outdated_report import OutdatedReport
 from .part_state import PartState
-from .states import load_state, state_file_path
 
 logger = logging.getLogger(__name__)
 
@@ -149,13 +148,12 @@ class StateManager:
         self._project_info = project_info
         self._part_list = part_list
         self._source_handler_cache: Dict[str, Optional[SourceHandler]] = {}
+        self._part_properties_cache: Dict[str, Dict[str, Any]] = {}
 
-        part_step_list = _sort_steps_by_state_timestamp(part_list)
+        part_step_list = _load_states_sorted_by_timestamp(part_list)
 
-        for part, step, _ in part_step_list:
-            state = load_state(part, step)
-            if state:
-                self.set_state(part, step, state=state)
+        for part, step, state, _ in part_step_list:
+            self.set_state(part, step, state=state)
 
     def set_state(self, part: Part, step: Step, *, state: PartState) -> None:
         """Set the ephemeral state of the given part and step."""
@@ -305,7 +303,11 @@ class StateManager:
             # about, and we're comparing it to those same keys in the current
             # state (current_properties). If they've changed, then this step
             # is dirty and needs to run again.
-            part_properties = part.spec.marshal()
+            part_properties = self._part_properties_cache.get(part.name)
+            if part_properties is None:
+                part_properties = part.spec.marshal()
+                self._part_properties_cache[part.name] = part_properties
+
             properties = state.diff_properties_of_interest(part_properties)
 
             # state project_options contains the old project options that this
@@ -379,26 +381,23 @@ class StateManager:
         return None
 
 
-def _sort_steps_by_state_timestamp(
+def _load_states_sorted_by_timestamp(
     part_list: List[Part],
-) -> List[Tuple[Part, Step, int]]:
-    """Sort steps based on state file timestamp.
+) -> List[Tuple[Part, Step, PartState, int]]:
+    """Load states and sort them based on state file timestamp.
 
-    Return a sorted list of parts and steps according to the timestamp
-    of the state file for the part and step. If there's no corresponding
-    state file, the step is ignored.
+    Return a sorted list of parts, steps and states according to the
+    timestamp of the state file for the part and step. If there's no
+    corresponding state file, the step is ignored.
 
     :param part_list: The list of all parts whose steps should be sorted.
 
-    :return: The sorted list of tuples containing part, step, and state
-        file modification time.
+    :return: The sorted list of tuples containing part, step, state, and
+        state file modification time.
     """
-    state_files: List[Tuple[Part, Step, int]] = []
+    state_files: List[Tuple[Part, Step, PartState, int]] = []
     for part in part_list:
-        for step in list(Step):
-            path = state_file_path(part, step)
-            if path.is_file():
-                mtime = path.stat().st_mtime_ns
-                state_files.append((part, step, mtime))
+        for step, state, mtime in states.load_step_states(part):
+            state_files.append((part, step, state, mtime))
 
-    return sorted(state_files, key=lambda item: item[2])
+    return sorted(state_files, key=lambda item: item[3])
@@ -16,18 +16,19 @@
 
 """The part state for a given step."""
 
+import json
 import os
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, Set
+from typing import Any, Dict, Optional, Set
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from pydantic_yaml import YamlModel  # type: ignore
 
 from craft_parts.utils import yaml_utils
 
 
-class _State(yaml_utils.YAMLObject):
+class _State:
     def __init__(self, yaml_data: Dict[str, Any] = None):
         if yaml_data:
             self.__dict__.update(yaml_data)
@@ -45,14 +46,31 @@ class _State(yaml_utils.YAMLObject):
 
         return False
 
+    @classmethod
+    def unmarshal(cls, data: Dict[str, Any]) -> "_State":
+        """Create and populate a new state object from dictionary data.
+
+        :param data: The dictionary data to unmarshal.
+
+        :return: The newly created object.
+        """
+        state = cls.__new__(cls)
+        state.__dict__.update(data)
+        return state
+
+    def marshal(self) -> Dict[str, Any]:
+        """Create a dictionary containing the state data.
+
+        :return: The newly created dictionary.
+        """
+        return dict(self.__dict__)
+
     def write(self, filepath: Path) -> None:
         """Write this state to disk."""
 
         os.makedirs(filepath.parent, exist_ok=True)
         with open(filepath, "w") as f:
-            data = yaml_utils.dump(self)
-            if data:
-                f.write(data)
+            yaml_utils.dump(self.marshal(), stream=f)
 
 
 class GlobalState(_State):
@@ -72,6 +90,10 @@ class PartState(YamlModel, ABC):
     files: Set[str] = set()
     directories: Set[str] = set()
 
+    # The properties of interest of this state never change, as the
+    # model is immutable. Keep them to avoid rebuilding on each diff.
+    _properties_of_interest: Optional[Dict[str, Any]] = PrivateAttr(None)
+
     class Config:
         """Pydantic model configuration."""
 
@@ -94,8 +116,13 @@ class PartState(YamlModel, ABC):
     def diff_properties_of_interest(self, other_properties: Dict[str, Any]) -> Set[str]:
         """Return set of properties that differ."""
 
+        if self._properties_of_interest is None:
+            self._properties_of_interest = self.properties_of_interest(
+                self.part_properties
+            )
+
         return _get_differing_keys(
-            self.properties_of_interest(self.part_properties),
+            self._properties_of_interest,
             self.properties_of_interest(other_properties),
         )
 
@@ -117,12 +144,15 @@ class PartState(YamlModel, ABC):
         return self.dict(by_alias=True)
 
     def write(self, filepath: Path) -> None:
-        """Write this state to disk."""
+        """Write this state to disk.
+
+        The state is written in JSON format, which can be loaded faster
+        than YAML and is still a valid YAML document.
+        """
 
         os.makedirs(filepath.parent, exist_ok=True)
-        yaml_data = self.yaml(by_alias=True)
         with open(filepath, "w") as f:
-            f.write(yaml_data)
+            json.dump(self.marshal(), f, default=_json_default)
 
 
 def _get_differing_keys(dict1, dict2) -> Set[str]:
@@ -138,3 +168,11 @@ def _get_differing_keys(dict1, dict2) -> Set[str]:
             differing_keys.add(key)
 
     return differing_keys
+
+
+def _json_default(obj: Any) -> Any:
+    # sets are not JSON serializable, write them as sorted lists
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+
+    raise TypeError(f"{type(obj).__name__!r} is not JSON serializable")
@@ -17,59 +17,108 @@
 """Helpers and definitions for lifecycle states."""
 
 import contextlib
+import json
 import logging
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, cast
-
-import yaml
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from craft_parts import errors
 from craft_parts.parts import Part
 from craft_parts.steps import Step
-from craft_parts.utils import file_utils
+from craft_parts.utils import yaml_utils
 
 from .build_state import BuildState
-from .part_state import GlobalState, PartState
+from .part_state import PartState
 from .prime_state import PrimeState
 from .pull_state import PullState
 from .stage_state import StageState
 
 logger = logging.getLogger(__name__)
 
+# State file names, one per step.
+_STATE_FILE_NAMES: Dict[Step, str] = {step: step.name.lower() for step in Step}
+
+
+def _load_state(filename: Union[Path, str]) -> Tuple[Dict[str, Any], os.stat_result]:
+    """Load state data and obtain the state file status.
 
-def _load_state(filename: Path) -> Dict[str, Any]:
+    The file status is obtained from the open file, so no additional
+    lookups are needed to check for the file existence and timestamp.
+    """
     logger.debug("load state file: %s", filename)
 
     with open(filename) as f:
-        state_data = yaml.safe_load(f)
+        stat = os.fstat(f.fileno())
+        data = f.read()
+
+    return _parse_state(data), stat
+
 
-    return state_data
+def _parse_state(data: str) -> Dict[str, Any]:
+    # State files are written in JSON, which is also valid YAML. Use the
+    # faster JSON parser and fall back to YAML for files written by hand
+    # or by previous versions.
+    if data.startswith("{"):
+        with contextlib.suppress(ValueError):
+            return json.loads(data)
+
+    return yaml_utils.safe_load(data)
 
 
 def load_global_state(
     filename: Path,
-) -> Tuple[Optional[GlobalState], Optional[datetime]]:
-    if not filename.is_file():
+) -> Tuple[Optional[Dict[str, Any]], Optional[datetime]]:
+    """Retrieve the global state data and timestamp.
+
+    The state data is returned as a dictionary, to be unmarshaled by
+    the corresponding global state class.
+    """
+    try:
+        state_data, stat = _load_state(filename)
+    except FileNotFoundError:
         return None, None
 
-    state_data = _load_state(filename)
-    timestamp = file_utils.timestamp(str(filename))
-    state = cast(GlobalState, state_data)
+    timestamp = datetime.fromtimestamp(stat.st_mtime)
 
-    return state, timestamp
+    return state_data, timestamp
 
 
 def load_state(part: Part, step: Step) -> Optional[PartState]:
     """Retrieve the persistent state for the given part and step."""
 
     filename = state_file_path(part, step)
-    if not filename.is_file():
+    try:
+        state_data, _ = _load_state(filename)
+    except FileNotFoundError:
         return None
 
-    state_data = _load_state(filename)
+    return _unmarshal_state(step, state_data)
+
+
+def load_step_states(part: Part) -> List[Tuple[Step, PartState, int]]:
+    """Retrieve the persistent states of all steps that ran for the given part.
+
+    :param part: The part whose states should be loaded.
 
+    :return: A list of tuples containing the step, its state, and the state
+        file modification time in nanoseconds.
+    """
+    step_states: List[Tuple[Step, PartState, int]] = []
+    for step, filename in _state_file_entries(part).items():
+        try:
+            state_data, stat = _load_state(filename)
+        except FileNotFoundError:
+            continue
+
+        state = _unmarshal_state(step, state_data)
+        step_states.append((step, state, stat.st_mtime_ns))
+
+    return step_states
+
+
+def _unmarshal_state(step: Step, state_data: Dict[str, Any]) -> PartState:
     if step == Step.PULL:
         state = PullState.unmarshal(state_data)
     elif step == Step.BUILD:
@@ -95,6 +144,23 @@ def load_part_states(step: Step, part_list: List[Part]) -> Dict[str, PartState]:
     return states
 
 
+def _state_file_entries(part: Part) -> Dict[Step, str]:
+    """Map the steps with a state file to the state file path.
+
+    Paths are taken from the directory entries as strings, so no path
+    objects are created when loading all states for a part.
+    """
+    try:
+        with os.scandir(part.part_state_dir) as entries:
+            paths = {entry.name: entry.path for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return {}
+
+    return {
+        step: paths[name] for step, name in _STATE_FILE_NAMES.items() if name in paths
+    }
+
+
 def is_clean(part: Part, step: Step) -> bool:
     """Verify whether the persistent state for the given part and step is clean."""
 
@@ -105,9 +171,9 @@ def is_clean(part: Part, step: Step) -> bool:
 def remove(part: Part, step: Step):
     """Remove the persistent state file for the given part and step."""
     with contextlib.suppress(FileNotFoundError):
-        os.remove(part.part_state_dir / step.name.lower())
+        os.remove(state_file_path(part, step))
 
 
 def state_file_path(part: Part, step: Step) -> Path:
     """Return the path to the state file for the give part and step."""
-    return part.part_state_dir / step.name.lower()
+    return part.part_state_dir / _STATE_FILE_NAMES[step]
@@ -17,19 +17,24 @@
 """File-related utilities."""
 
 import contextlib
-import errno
+import functools
 import hashlib
+import itertools
 import logging
 import os
 import shutil
 import sys
 from datetime import datetime
-from typing import Callable, List, Set
+from stat import S_IMODE, S_ISLNK
+from typing import Callable, FrozenSet, List
 
 from craft_parts import errors
 
 logger = logging.getLogger(__name__)
 
+# The filesystem encoding doesn't change during the process lifetime.
+_FS_ENCODING = sys.getfilesystemencoding()
+
 
 class NonBlockingRWFifo:
     """A non-blocking FIFO for reading and writing."""
@@ -43,6 +48,11 @@ class NonBlockingRWFifo:
         # is in place)
         self._fd = os.open(self._path, os.O_RDWR | os.O_NONBLOCK)
 
+        # Reusable read buffer, large enough to drain a full pipe (64KiB on
+        # Linux) in a single call.
+        self._buffer = bytearray(65536)
+        self._view = memoryview(self._buffer)
+
     @property
     def path(self) -> str:
         """The path to the FIFO file."""
@@ -52,18 +62,22 @@ class NonBlockingRWFifo:
     def read(self) -> str:
         """Read from the FIFO."""
 
-        total_read = ""
+        buf = bytearray()
+        fd = self._fd
+        view = self._view
+        buffers = [view]
         with contextlib.suppress(BlockingIOError):
-            value = os.read(self._fd, 1024)
-            while value:
-                total_read += value.decode(sys.getfilesystemencoding())
-                value = os.read(self._fd, 1024)
-        return total_read
+            while True:
+                size = os.readv(fd, buffers)
+                if not size:
+                    break
+                buf += view[:size]
+        return buf.decode(_FS_ENCODING)
 
     def write(self, data: str) -> int:
         """Write to the FIFO."""
 
-        return os.write(self._fd, data.encode(sys.getfilesystemencoding()))
+        return os.write(self._fd, data.encode(_FS_ENCODING))
 
     def close(self) -> None:
         """Close the FIFO."""
@@ -89,19 +103,32 @@ def link_or_copy(source: str, destination: str, follow_symlinks: bool = False) -
     :param bool follow_symlinks: Whether or not symlinks should be followed.
     """
 
+    _link_or_copy(
+        source, destination, follow_symlinks=follow_symlinks, create_parent=True
+    )
+
+
+def _link_or_copy(
+    source: str, destination: str, *, follow_symlinks: bool, create_parent: bool
+) -> None:
+    if not follow_symlinks and os.path.islink(source):
+        copy(source, destination)
+        return
+
+    # os.link will fail if the destination already exists, so remove it
+    # before linking instead of handling the error and trying again.
+    if os.path.lexists(destination) and not os.path.isdir(destination):
+        os.remove(destination)
+
     try:
-        if not follow_symlinks and os.path.islink(source):
-            copy(source, destination)
-        else:
-            link(source, destination, follow_symlinks=follow_symlinks)
-    except OSError as err:
-        if err.errno == errno.EEXIST and not os.path.isdir(destination):
-            # os.link will fail if the destination already exists, so let's
-            # remove it and try again.
-            os.remove(destination)
-            link_or_copy(source, destination, follow_symlinks)
-        else:
-            copy(source, destination, follow_symlinks=follow_symlinks)
+        _link(
+            source,
+            destination,
+            follow_symlinks=follow_symlinks,
+            create_parent=create_parent,
+        )
+    except OSError:
+        copy(source, destination, follow_symlinks=follow_symlinks)
 
 
 def link(source: str, destination: str, *, follow_symlinks: bool = False) -> None:
@@ -113,13 +140,19 @@ def link(source: str, destination: str, *, follow_symlinks: bool = False) -> Non
 
     :raises CopyFileNotFound: If source doesn't exist.
     """
+    _link(source, destination, follow_symlinks=follow_symlinks, create_parent=True)
+
+
+def _link(
+    source: str, destination: str, *, follow_symlinks: bool, create_parent: bool
+) -> None:
     # Note that follow_symlinks doesn't seem to work for os.link, so we'll
     # implement this logic ourselves using realpath.
     source_path = source
     if follow_symlinks:
         source_path = os.path.realpath(source)
 
-    if not os.path.exists(os.path.dirname(destination)):
+    if create_parent and not os.path.exists(os.path.dirname(destination)):
         create_similar_directory(
             os.path.dirname(source_path), os.path.dirname(destination)
         )
@@ -155,11 +188,10 @@ def copy(source: str, destination: str, *, follow_symlinks: bool = False) -> Non
     except FileNotFoundError as err:
         raise errors.CopyFileNotFound(source) from err
 
-    uid = os.stat(source, follow_symlinks=follow_symlinks).st_uid
-    gid = os.stat(source, follow_symlinks=follow_symlinks).st_gid
+    stat = os.stat(source, follow_symlinks=follow_symlinks)
 
     try:
-        os.chown(destination, uid, gid, follow_symlinks=follow_symlinks)
+        os.chown(destination, stat.st_uid, stat.st_gid, follow_symlinks=follow_symlinks)
     except PermissionError as err:
         logger.debug("Unable to chown %s: %s", destination, err)
 
@@ -195,45 +227,70 @@ def link_or_copy_tree(
 
     create_similar_directory(source_tree, destination_tree)
 
-    destination_basename = os.path.basename(destination_tree)
+    if copy_function is link_or_copy:
+        # Destination directories are created while walking the tree, so
+        # there's no need to verify the parent directory of each file.
+        copy_function = functools.partial(
+            _link_or_copy, follow_symlinks=False, create_parent=False
+        )
 
-    for root, directories, files in os.walk(source_tree, topdown=True):
-        ignored: Set[str] = set()
+    # Don't recurse into destination tree if it's a subdirectory of the
+    # source tree.
+    destination_parent = os.path.dirname(os.path.abspath(destination_tree))
+    destination_basename = os.path.basename(os.path.abspath(destination_tree))
+
+    # Walk the tree using the directory entries returned by scandir, so file
+    # types are obtained without additional stat calls.
+    stack = [(source_tree, destination_tree)]
+    while stack:
+        source_dir, destination_dir = stack.pop()
+        try:
+            with os.scandir(source_dir) as entries:
+                entry_list = list(entries)
+        except OSError:
+            # unreadable directories are skipped, as os.walk does
+            continue
+
+        directories: List[os.DirEntry] = []
+        files: List[os.DirEntry] = []
+        for entry in entry_list:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                directories.append(entry)
+            else:
+                files.append(entry)
+
+        ignored: FrozenSet[str] = frozenset()
         if ignore is not None:
-            ignored = set(ignore(root, directories + files))
-
-        # Don't recurse into destination tree if it's a subdirectory of the
-        # source tree.
-        if os.path.relpath(destination_tree, root) == destination_basename:
-            ignored.add(destination_basename)
-
-        if ignored:
-            # Prune our search appropriately given an ignore list, i.e. don't
-            # walk into directories that are ignored.
-            directories[:] = [d for d in directories if d not in ignored]
-
-        for directory in directories:
-            source = os.path.join(root, directory)
-            # os.walk doesn't by default follow symlinks (which is good), but
-            # it includes symlinks that are pointing to directories in the
-            # directories list. We want to treat it as a file, here.
-            if os.path.islink(source):
-                files.append(directory)
+            names = [e.name for e in itertools.chain(directories, files)]
+            ignored = frozenset(ignore(source_dir, names))
+
+        if os.path.abspath(source_dir) == destination_parent:
+            ignored = ignored.union((destination_basename,))
+
+        destination_prefix = os.path.join(destination_dir, "")
+
+        for entry in directories:
+            if entry.name in ignored:
                 continue
 
-            destination = os.path.join(
-                destination_tree, os.path.relpath(source, source_tree)
-            )
+            # Symlinks pointing to directories are treated as files.
+            if entry.is_symlink():
+                files.append(entry)
+                continue
 
-            create_similar_directory(source, destination)
+            destination = destination_prefix + entry.name
+            create_similar_directory(entry.path, destination)
+            stack.append((entry.path, destination))
 
-        for file_name in set(files) - ignored:
-            source = os.path.join(root, file_name)
-            destination = os.path.join(
-                destination_tree, os.path.relpath(source, source_tree)
-            )
+        for entry in files:
+            if entry.name in ignored:
+                continue
 
-            copy_function(source, destination)
+            copy_function(entry.path, destination_prefix + entry.name)
 
 
 def create_similar_directory(source: str, destination: str) -> None:
@@ -246,21 +303,26 @@ def create_similar_directory(source: str, destination: str) -> None:
     """
 
     stat = os.stat(source, follow_symlinks=False)
-    uid = stat.st_uid
-    gid = stat.st_gid
     os.makedirs(destination, exist_ok=True)
 
-    # Windows does not have "os.chown" implementation and copystat
-    # is unlikely to be useful, so just bail after creating directory.
+    # Windows does not have "os.chown" implementation and copying the
+    # status is unlikely to be useful, so just bail after creating directory.
     if sys.platform == "win32":
         return
 
     try:
-        os.chown(destination, uid, gid, follow_symlinks=False)
+        os.chown(destination, stat.st_uid, stat.st_gid, follow_symlinks=False)
     except PermissionError as exception:
         logger.debug("Unable to chown %s: %s", destination, exception)
 
-    shutil.copystat(source, destination, follow_symlinks=False)
+    # The destination is a directory, so take the mode and times from the
+    # symlink target as shutil.copystat would. Otherwise reuse the source
+    # stat instead of having copystat stat it again.
+    if S_ISLNK(stat.st_mode):
+        stat = os.stat(source)
+
+    os.chmod(destination, S_IMODE(stat.st_mode))
+    os.utime(destination, ns=(stat.st_atime_ns, stat.st_mtime_ns))
 
 
 def get_resolved_relative_path(relative_path: str, base_directory: str) -> str:
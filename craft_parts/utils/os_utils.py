@@ -17,29 +17,33 @@
 """Utilities related to the operating system."""
 
 import contextlib
+import functools
 import logging
 import os
 import pathlib
+import re
 import shutil
 import subprocess
 import sys
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 from craft_parts import errors
 
 logger = logging.getLogger(__name__)
 
+# Common system directories, as path components relative to the root.
+_BIN_DIRECTORIES = (("usr", "sbin"), ("usr", "bin"), ("sbin",), ("bin",))
+_INCLUDE_DIRECTORIES = (("include",), ("usr", "include"))
+_LIBRARY_DIRECTORIES = (("lib",), ("usr", "lib"))
+
 
 def get_bin_paths(*, root: Union[str, pathlib.Path], existing_only=True) -> List[str]:
     """List common system executable paths."""
 
-    paths = (os.path.join("usr", "sbin"), os.path.join("usr", "bin"), "sbin", "bin")
-    rooted_paths = (os.path.join(root, p) for p in paths)
-
     if existing_only:
-        return [p for p in rooted_paths if os.path.exists(p)]
+        return _existing_paths(root, _BIN_DIRECTORIES)
 
-    return list(rooted_paths)
+    return _rooted_paths(root, _BIN_DIRECTORIES)
 
 
 def get_include_paths(
@@ -48,13 +52,11 @@ def get_include_paths(
     """List common include paths."""
 
     paths = [
-        os.path.join(root, "include"),
-        os.path.join(root, "usr", "include"),
-        os.path.join(root, "include", arch_triplet),
-        os.path.join(root, "usr", "include", arch_triplet),
+        *_INCLUDE_DIRECTORIES,
+        *(p + (arch_triplet,) for p in _INCLUDE_DIRECTORIES),
     ]
 
-    return [p for p in paths if os.path.exists(p)]
+    return _existing_paths(root, paths)
 
 
 def get_library_paths(
@@ -66,16 +68,14 @@ def get_library_paths(
     the root that was set.
     """
     paths = [
-        os.path.join(root, "lib"),
-        os.path.join(root, "usr", "lib"),
-        os.path.join(root, "lib", arch_triplet),
-        os.path.join(root, "usr", "lib", arch_triplet),
+        *_LIBRARY_DIRECTORIES,
+        *(p + (arch_triplet,) for p in _LIBRARY_DIRECTORIES),
     ]
 
     if existing_only:
-        paths = [p for p in paths if os.path.exists(p)]
+        return _existing_paths(root, paths)
 
-    return paths
+    return _rooted_paths(root, paths)
 
 
 def get_pkg_config_paths(
@@ -84,17 +84,36 @@ def get_pkg_config_paths(
     """List common pkg-config paths."""
 
     paths = [
-        os.path.join(root, "lib", "pkgconfig"),
-        os.path.join(root, "lib", arch_triplet, "pkgconfig"),
-        os.path.join(root, "usr", "lib", "pkgconfig"),
-        os.path.join(root, "usr", "lib", arch_triplet, "pkgconfig"),
-        os.path.join(root, "usr", "share", "pkgconfig"),
-        os.path.join(root, "usr", "local", "lib", "pkgconfig"),
-        os.path.join(root, "usr", "local", "lib", arch_triplet, "pkgconfig"),
-        os.path.join(root, "usr", "local", "share", "pkgconfig"),
+        ("lib", "pkgconfig"),
+        ("lib", arch_triplet, "pkgconfig"),
+        ("usr", "lib", "pkgconfig"),
+        ("usr", "lib", arch_triplet, "pkgconfig"),
+        ("usr", "share", "pkgconfig"),
+        ("usr", "local", "lib", "pkgconfig"),
+        ("usr", "local", "lib", arch_triplet, "pkgconfig"),
+        ("usr", "local", "share", "pkgconfig"),
     ]
 
-    return [p for p in paths if os.path.exists(p)]
+    return _existing_paths(root, paths)
+
+
+def _rooted_paths(
+    root: Union[str, pathlib.Path], paths: Sequence[Tuple[str, ...]]
+) -> List[str]:
+    """Join each path, given as a tuple of path components, to root."""
+    prefix = os.path.join(root, "")
+    return [prefix + "/".join(p) for p in paths]
+
+
+def _existing_paths(
+    root: Union[str, pathlib.Path], paths: Sequence[Tuple[str, ...]]
+) -> List[str]:
+    """Return the paths under root that exist in the filesystem.
+
+    As with os.path.lexists, a symlink to a missing target is considered
+    to exist.
+    """
+    return [p for p in _rooted_paths(root, paths) if os.path.lexists(p)]
 
 
 # FIXME: investigate environment setting
@@ -104,8 +123,13 @@ def reset_env() -> None:
     # env = []
 
 
+@functools.lru_cache(maxsize=1)
 def is_dumb_terminal() -> bool:
-    """Return True if on a dumb terminal."""
+    """Return True if on a dumb terminal.
+
+    The terminal type doesn't change during execution, so the result is
+    computed only once.
+    """
     is_stdout_tty = os.isatty(1)
     is_term_dumb = os.environ.get("TERM", "") == "dumb"
     return not is_stdout_tty or is_term_dumb
@@ -217,17 +241,22 @@ def umount(mountpoint: str) -> None:
     subprocess.check_call(["/bin/umount", mountpoint])
 
 
+# Directories searched for commands, relative to the root directory.
+_COMMAND_DIRECTORIES = (
+    "usr/local/sbin",
+    "usr/local/bin",
+    "usr/sbin",
+    "usr/bin",
+    "sbin",
+    "bin",
+)
+
+
 def _find_command_path_in_root(root, command_name: str) -> Optional[str]:
-    for bin_directory in (
-        os.path.join("usr", "local", "sbin"),
-        os.path.join("usr", "local", "bin"),
-        os.path.join("usr", "sbin"),
-        os.path.join("usr", "bin"),
-        os.path.join("sbin"),
-        os.path.join("bin"),
-    ):
-        path = os.path.join(root, bin_directory, command_name)
-        if os.path.exists(path):
+    prefix = os.path.join(root, "")
+    for bin_directory in _COMMAND_DIRECTORIES:
+        path = f"{prefix}{bin_directory}/{command_name}"
+        if os.path.isfile(path):
             return path
 
     return None
@@ -250,13 +279,7 @@ class OsRelease:
         :param str os_release_file: Path to os-release file to be parsed.
         """
 
-        self._os_release = {}  # type: Dict[str, str]
-        with contextlib.suppress(FileNotFoundError):
-            with open(os_release_file) as f:
-                for line in f:
-                    entry = line.rstrip().split("=")
-                    if len(entry) == 2:
-                        self._os_release[entry[0]] = entry[1].strip('"')
+        self._os_release = _parse_os_release(os_release_file)
 
     def id(self) -> str:
         """Return the OS ID
@@ -300,12 +323,39 @@ class OsRelease:
 
         # pyright doesn't like "with contextlib.suppress(KeyError)"
 
-        release = self._os_release.get("VERSION_CODENAME")
+        os_release = self._os_release
+        release = os_release.get("VERSION_CODENAME")
         if release:
             return release
 
-        ver_id = self._os_release.get("VERSION_ID")
-        if ver_id and release in _ID_TO_UBUNTU_CODENAME:
-            return _ID_TO_UBUNTU_CODENAME[ver_id]
+        ver_id = os_release.get("VERSION_ID")
+        if ver_id:
+            release = _ID_TO_UBUNTU_CODENAME.get(ver_id)
+            if release:
+                return release
 
         raise errors.OsReleaseCodenameError()
+
+
+# Match KEY=value or KEY="value" entries in os-release files.
+_OS_RELEASE_ENTRY_REGEX = re.compile(r'^(\w+)="?([^"\n]*?)"?[ \t]*$', re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_os_release(os_release_file: str) -> Dict[str, str]:
+    """Parse an os-release file.
+
+    The file is static during the process lifetime, so each path is read
+    only once. The returned dictionary is shared and must not be modified.
+
+    :param os_release_file: Path to the os-release file to be parsed.
+
+    :return: A dictionary containing the os-release entries.
+    """
+    try:
+        with open(os_release_file) as f:
+            content = f.read()
+    except FileNotFoundError:
+        return {}
+
+    return dict(_OS_RELEASE_ENTRY_REGEX.findall(content))
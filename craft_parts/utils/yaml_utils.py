@@ -16,7 +16,8 @@
 
 """YAML file handling utilities."""
 
-import collections
+import functools
+import logging
 from typing import Any, Dict, Optional, TextIO, Union
 
 import yaml
@@ -29,28 +30,23 @@ try:
     import yaml.constructor
     from yaml import CSafeDumper as SafeDumper  # type: ignore
     from yaml import CSafeLoader as SafeLoader
+
+    _HAS_LIBYAML = True
 except ImportError:
     from yaml import SafeDumper, SafeLoader  # type: ignore
 
+    _HAS_LIBYAML = False
+
+logger = logging.getLogger(__name__)
+
 
 class _SafeOrderedLoader(SafeLoader):  # type: ignore
     """C-based SafeLoader wrapper."""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.add_constructor(
-            yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _dict_constructor
-        )
-
 
 class _SafeOrderedDumper(SafeDumper):  # type: ignore
     """C-based SafeDumper wrapper."""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.add_representer(str, _str_presenter)
-        self.add_representer(collections.OrderedDict, _dict_representer)
-
 
 def _dict_constructor(loader, node):
     # Necessary in order to make yaml merge tags work
@@ -58,7 +54,7 @@ def _dict_constructor(loader, node):
     value = loader.construct_pairs(node)
 
     try:
-        return collections.OrderedDict(value)
+        return dict(value)
     except TypeError as type_error:
         raise yaml.constructor.ConstructorError(
             "while constructing a mapping",
@@ -68,8 +64,8 @@ def _dict_constructor(loader, node):
         ) from type_error
 
 
-def _dict_representer(dumper, data):
-    return dumper.represent_dict(data.items())
+def _set_representer(dumper, data):
+    return dumper.represent_list(sorted(data))
 
 
 def _str_presenter(dumper, data):
@@ -78,16 +74,36 @@ def _str_presenter(dumper, data):
     return dumper.represent_scalar("tag:yaml.org,2002:str", data)
 
 
+# Register constructors and representers once in the class instead of
+# doing it every time a loader or dumper is instantiated.
+_SafeOrderedLoader.add_constructor(
+    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _dict_constructor
+)
+_SafeOrderedDumper.add_representer(str, _str_presenter)
+_SafeOrderedDumper.add_representer(set, _set_representer)
+
+
+@functools.lru_cache(maxsize=None)
+def _check_libyaml() -> None:
+    """Warn (only once) if the C-based loader is not available."""
+    if not _HAS_LIBYAML:
+        logger.warning("libyaml bindings not available, YAML loading will be slow")
+
+
 def load(stream: Union[str, TextIO]) -> Dict[str, Any]:
     """Safely load YAML in ordered manner."""
+    _check_libyaml()
     return yaml.load(stream, Loader=_SafeOrderedLoader)
 
 
+def safe_load(stream: Union[str, TextIO]) -> Any:
+    """Safely load YAML, using the C-based loader if available."""
+    _check_libyaml()
+    return yaml.load(stream, Loader=SafeLoader)
+
+
 def dump(
-    data: Union[Dict[str, Any], yaml.YAMLObject],
-    *,
-    stream: Optional[TextIO] = None,
-    sort_keys=True
+    data: Dict[str, Any], *, stream: Optional[TextIO] = None, sort_keys=True
 ) -> Optional[str]:
     """Safely dump YAML in ordered manner."""
 
@@ -99,10 +115,3 @@ def dump(
         allow_unicode=True,
         sort_keys=sort_keys,
     )
-
-
-class YAMLObject(yaml.YAMLObject):
-    """YAML object wrapper."""
-
-    yaml_loader = SafeLoader
-    yaml_dumper = SafeDumper
@@ -36,40 +36,51 @@ def pytest_configure(config):
 
 
 @pytest.fixture
-def new_dir(tmpdir):
+def new_dir(tmpdir, monkeypatch):
     """Change to a new temporary directory."""
 
-    cwd = os.getcwd()
-    os.chdir(tmpdir)
-
-    yield tmpdir
-
-    os.chdir(cwd)
+    monkeypatch.chdir(tmpdir)
+    return tmpdir
 
 
 @pytest.fixture(autouse=True)
-def temp_xdg(tmpdir, mocker):
+def temp_xdg(tmpdir, monkeypatch):
     """Use a temporary locaction for XDG directories."""
 
-    mocker.patch(
-        "xdg.BaseDirectory.xdg_config_home", new=os.path.join(tmpdir, ".config")
-    )
-    mocker.patch("xdg.BaseDirectory.xdg_data_home", new=os.path.join(tmpdir, ".local"))
-    mocker.patch("xdg.BaseDirectory.xdg_cache_home", new=os.path.join(tmpdir, ".cache"))
-    mocker.patch(
-        "xdg.BaseDirectory.xdg_config_dirs", new=[xdg.BaseDirectory.xdg_config_home]
+    config_home = os.path.join(tmpdir, ".config")
+    data_home = os.path.join(tmpdir, ".local")
+
+    # Set the attributes directly, monkeypatch restores them after the test.
+    base_directory = xdg.BaseDirectory
+    monkeypatch.setattr(base_directory, "xdg_config_home", config_home)
+    monkeypatch.setattr(base_directory, "xdg_data_home", data_home)
+    monkeypatch.setattr(
+        base_directory, "xdg_cache_home", os.path.join(tmpdir, ".cache")
     )
-    mocker.patch(
-        "xdg.BaseDirectory.xdg_data_dirs", new=[xdg.BaseDirectory.xdg_data_home]
+    monkeypatch.setattr(base_directory, "xdg_config_dirs", [config_home])
+    monkeypatch.setattr(base_directory, "xdg_data_dirs", [data_home])
+    monkeypatch.setenv("XDG_CONFIG_HOME", config_home)
+
+
+@pytest.fixture(scope="session")
+def http_server_session():
+    """Provide an http server shared by all tests in the session."""
+
+    server = http.server.HTTPServer(
+        ("127.0.0.1", 0), fake_servers.DummyHTTPRequestHandler
     )
-    with mock.patch.dict(
-        os.environ, {"XDG_CONFIG_HOME": os.path.join(tmpdir, ".config")}
-    ):
-        yield
+    server_thread = threading.Thread(target=server.serve_forever)
+    server_thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+    server_thread.join()
 
 
 @pytest.fixture(scope="class")
-def http_server(request):
+def http_server(request, http_server_session):
     """Provide an http server with configurable request handlers."""
 
     marker = request.node.get_closest_marker("http_request_handler")
@@ -78,15 +89,13 @@ def http_server(request):
     else:
         handler = fake_servers.DummyHTTPRequestHandler
 
-    server = http.server.HTTPServer(("127.0.0.1", 0), handler)
-    server_thread = threading.Thread(target=server.serve_forever)
-    server_thread.start()
+    # The server instantiates its handler class for each request, so the
+    # handler can be replaced without restarting the server.
+    http_server_session.RequestHandlerClass = handler
 
-    yield server
+    yield http_server_session
 
-    server.shutdown()
-    server.server_close()
-    server_thread.join()
+    http_server_session.RequestHandlerClass = fake_servers.DummyHTTPRequestHandler
 
 
 @pytest.fixture(scope="class")
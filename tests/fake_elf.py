@@ -16,6 +16,7 @@
 
 import os
 import shutil
+from typing import Any, Dict
 
 from craft_parts.utils import elf_utils
 from tests import TESTS_DIR
@@ -38,18 +39,16 @@ class FakeElf:
             (new_binaries_path / f).chmod(0o755)
 
         # Some values in ldd need to be set with core_path
-        with open(binaries_path / "ldd") as rf:
-            with open(new_binaries_path / "ldd", "w") as wf:
-                for line in rf.readlines():
-                    wf.write(line.replace("{CORE_PATH}", str(self.core_base_path)))
+        ldd = (binaries_path / "ldd").read_text()
+        with open(new_binaries_path / "ldd", "w") as f:
+            f.write(ldd.replace("{CORE_PATH}", str(self.core_base_path)))
         (new_binaries_path / "ldd").chmod(0o755)
 
-        # Some values in ldd need to be set with core_path
+        # The patchelf version needs to be set
         self.patchelf_path = new_binaries_path / "patchelf"
-        with open(binaries_path / "patchelf") as rf:
-            with open(self.patchelf_path, "w") as wf:
-                for line in rf.readlines():
-                    wf.write(line.replace("{VERSION}", self._patchelf_version))
+        patchelf = (binaries_path / "patchelf").read_text()
+        with open(self.patchelf_path, "w") as f:
+            f.write(patchelf.replace("{VERSION}", self._patchelf_version))
         (new_binaries_path / "patchelf").chmod(0o755)
 
         mocker.patch.object(
@@ -104,10 +103,10 @@ class FakeElf:
         }
 
         for elf_file in self._elf_files.values():
-            with open(elf_file.path, "wb") as f:
-                f.write(b"\x7fELF")
-                if elf_file.path.endswith("fake_elf-bad-patchelf"):
-                    f.write(b"nointerpreter")
+            if elf_file.path.endswith("fake_elf-bad-patchelf"):
+                _write_fake_elf(elf_file.path, b"\x7fELFnointerpreter")
+            else:
+                _write_fake_elf(elf_file.path)
 
         self.root_libraries = {
             "foo.so.1": os.path.join(self.root_path, "foo.so.1"),
@@ -117,16 +116,76 @@ class FakeElf:
         barsnap_elf = os.path.join(self.core_base_path, "barsnap.so.2")
         elf_list = [*self.root_libraries.values(), barsnap_elf]
 
+        for directory in {os.path.dirname(p) for p in elf_list}:
+            os.makedirs(directory, exist_ok=True)
+
         for root_library in elf_list:
-            os.makedirs(os.path.dirname(root_library), exist_ok=True)
-            with open(root_library, "wb") as f:
-                f.write(b"\x7fELF")
+            _write_fake_elf(root_library)
 
     def __getitem__(self, item):
         return self._elf_files[item]
 
 
-# pylint: disable=too-many-statements
+def _write_fake_elf(path: str, content: bytes = b"\x7fELF") -> None:
+    # The files are tiny, write them without creating buffered file objects.
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, content)
+    finally:
+        os.close(fd)
+
+
+_GLIBC_2_26 = {"libc.so.6": ("GLIBC_2.2.5", "GLIBC_2.26")}
+
+# Attributes of each fake ELF file. Needed libraries are described as a
+# mapping of library names to the versions they provide.
+_FAKE_ELF_ATTRIBUTES: Dict[str, Dict[str, Any]] = {
+    "fake_elf-2.26": {"needed": _GLIBC_2_26},
+    "fake_elf-bad-ldd": {"needed": _GLIBC_2_26},
+    "fake_elf-with-core-libs": {"needed": _GLIBC_2_26},
+    "fake_elf-with-missing-libs": {"needed": _GLIBC_2_26},
+    "fake_elf-bad-patchelf": {"needed": _GLIBC_2_26},
+    "fake_elf-with-host-libraries": {"needed": _GLIBC_2_26},
+    "fake_elf-2.23": {"needed": {"libc.so.6": ("GLIBC_2.2.5", "GLIBC_2.23")}},
+    "fake_elf-1.1": {"needed": {"libc.so.6": ("GLIBC_1.1", "GLIBC_0.1")}},
+    "fake_elf-static": {"is_dynamic": False},
+    "fake_elf-shared-object": {
+        "interp": "",
+        "soname": "libfake_elf.so.0",
+        "needed": {"libssl.so.1.0.0": ("OPENSSL_1.0.0",)},
+    },
+    "fake_elf-with-execstack": {
+        "needed": {"libc.so.6": ("GLIBC_2.23",)},
+        "execstack_set": True,
+    },
+    "fake_elf-with-bad-execstack": {
+        "needed": {"libc.so.6": ("GLIBC_2.23",)},
+        "execstack_set": True,
+    },
+    "libc.so.6": {
+        "interp": "",
+        "soname": "libc.so.6",
+        "versions": ("libc.so.6", "GLIBC_2.2.5", "GLIBC_2.23", "GLIBC_2.26"),
+    },
+    "libssl.so.1.0.0": {
+        "interp": "",
+        "soname": "libssl.so.1.0.0",
+        "versions": ("libssl.so.1.0.0", "OPENSSL_1.0.0"),
+    },
+}
+
+# Attributes of fake ELF files, unless overridden above.
+_FAKE_ELF_DEFAULT_ATTRIBUTES: Dict[str, Any] = {
+    "interp": "/lib64/ld-linux-x86-64.so.2",
+    "soname": "",
+    "versions": (),
+    "needed": {},
+    "execstack_set": False,
+    "is_dynamic": True,
+}
+
+# Attributes of files not listed above.
+_UNKNOWN_ELF_ATTRIBUTES: Dict[str, Any] = {"interp": ""}
 
 
 def _fake_elffile_extract_attributes(self):
@@ -135,120 +194,22 @@ def _fake_elffile_extract_attributes(self):
     self.arch = ("ELFCLASS64", "ELFDATA2LSB", "EM_X86_64")
     self.build_id = "build-id-{}".format(name)
 
-    if name in [
-        "fake_elf-2.26",
-        "fake_elf-bad-ldd",
-        "fake_elf-with-core-libs",
-        "fake_elf-with-missing-libs",
-        "fake_elf-bad-patchelf",
-        "fake_elf-with-host-libraries",
-    ]:
-        glibc = elf_utils.NeededLibrary(name="libc.so.6")
-        glibc.add_version("GLIBC_2.2.5")
-        glibc.add_version("GLIBC_2.26")
-
-        self.interp = "/lib64/ld-linux-x86-64.so.2"
-        self.soname = ""
-        self.versions = set()
-        self.needed = {glibc.name: glibc}
-        self.execstack_set = False
-        self.is_dynamic = True
-        self.has_debug_info = False
-
-    elif name == "fake_elf-2.23":
-        glibc = elf_utils.NeededLibrary(name="libc.so.6")
-        glibc.add_version("GLIBC_2.2.5")
-        glibc.add_version("GLIBC_2.23")
-
-        self.interp = "/lib64/ld-linux-x86-64.so.2"
-        self.soname = ""
-        self.versions = set()
-        self.needed = {glibc.name: glibc}
-        self.execstack_set = False
-        self.is_dynamic = True
-        self.has_debug_info = False
-
-    elif name == "fake_elf-1.1":
-        glibc = elf_utils.NeededLibrary(name="libc.so.6")
-        glibc.add_version("GLIBC_1.1")
-        glibc.add_version("GLIBC_0.1")
-
-        self.interp = "/lib64/ld-linux-x86-64.so.2"
-        self.soname = ""
-        self.versions = set()
-        self.needed = {glibc.name: glibc}
-        self.execstack_set = False
-        self.is_dynamic = True
-        self.has_debug_info = False
-
-    elif name == "fake_elf-static":
-        self.interp = "/lib64/ld-linux-x86-64.so.2"
-        self.soname = ""
-        self.versions = set()
-        self.needed = dict()
-        self.execstack_set = False
-        self.is_dynamic = False
-        self.has_debug_info = False
-
-    elif name == "fake_elf-shared-object":
-        openssl = elf_utils.NeededLibrary(name="libssl.so.1.0.0")
-        openssl.add_version("OPENSSL_1.0.0")
-
-        self.interp = ""
-        self.soname = "libfake_elf.so.0"
-        self.versions = set()
-        self.needed = {openssl.name: openssl}
-        self.execstack_set = False
-        self.is_dynamic = True
-        self.has_debug_info = False
-
-    elif name == "fake_elf-with-execstack":
-        glibc = elf_utils.NeededLibrary(name="libc.so.6")
-        glibc.add_version("GLIBC_2.23")
-
-        self.interp = "/lib64/ld-linux-x86-64.so.2"
-        self.soname = ""
-        self.versions = set()
-        self.needed = {glibc.name: glibc}
-        self.execstack_set = True
-        self.is_dynamic = True
-        self.has_debug_info = False
-
-    elif name == "fake_elf-with-bad-execstack":
-        glibc = elf_utils.NeededLibrary(name="libc.so.6")
-        glibc.add_version("GLIBC_2.23")
-
-        self.interp = "/lib64/ld-linux-x86-64.so.2"
-        self.soname = ""
-        self.versions = set()
-        self.needed = {glibc.name: glibc}
-        self.execstack_set = True
-        self.is_dynamic = True
-        self.has_debug_info = False
-
-    elif name == "libc.so.6":
-        self.interp = ""
-        self.soname = "libc.so.6"
-        self.versions = {"libc.so.6", "GLIBC_2.2.5", "GLIBC_2.23", "GLIBC_2.26"}
-        self.needed = {}
-        self.execstack_set = False
-        self.is_dynamic = True
-        self.has_debug_info = False
-
-    elif name == "libssl.so.1.0.0":
-        self.interp = ""
-        self.soname = "libssl.so.1.0.0"
-        self.versions = {"libssl.so.1.0.0", "OPENSSL_1.0.0"}
-        self.needed = {}
-        self.execstack_set = False
-        self.is_dynamic = True
-        self.has_debug_info = False
-
-    else:
-        self.interp = ""
-        self.soname = ""
-        self.versions = set()
-        self.needed = {}
-        self.execstack_set = False
-        self.is_dynamic = True
-        self.has_debug_info = False
+    attributes = {
+        **_FAKE_ELF_DEFAULT_ATTRIBUTES,
+        **_FAKE_ELF_ATTRIBUTES.get(name, _UNKNOWN_ELF_ATTRIBUTES),
+    }
+
+    needed = {}
+    for library_name, library_versions in attributes["needed"].items():
+        library = elf_utils.NeededLibrary(name=library_name)
+        for version in library_versions:
+            library.add_version(version)
+        needed[library_name] = library
+
+    self.interp = attributes["interp"]
+    self.soname = attributes["soname"]
+    self.versions = set(attributes["versions"])
+    self.needed = needed
+    self.execstack_set = attributes["execstack_set"]
+    self.is_dynamic = attributes["is_dynamic"]
+    self.has_debug_info = False
@@ -14,6 +14,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import functools
 import os
 import shutil
 import subprocess
@@ -38,42 +39,35 @@ class FakeSnapCommand:
         original_check_call = craft_parts.packages.snaps.check_call
         original_check_output = craft_parts.packages.snaps.check_output
 
-        def side_effect_check_call(cmd, *args, **kwargs):
-            return side_effect(original_check_call, cmd, *args, **kwargs)
-
-        def side_effect_check_output(cmd, *args, **kwargs):
-            if self._is_snap_command(cmd):
-                self.calls.append(cmd)
-                return self._fake_snap_command(cmd, *args, **kwargs)
-
-            return side_effect(original_check_output, cmd, *args, **kwargs)
-
-        def side_effect(original, cmd, *args, **kwargs):
-            if self._is_snap_command(cmd):
-                self.calls.append(cmd)
-                return self._fake_snap_command(cmd, *args, **kwargs)
-
-            return original(cmd, *args, **kwargs)
-
-        mocker.patch("craft_parts.packages.snaps.check_call", side_effect_check_call)
         mocker.patch(
-            "craft_parts.packages.snaps.check_output", side_effect_check_output
+            "craft_parts.packages.snaps.check_call",
+            functools.partial(self._side_effect, original_check_call),
         )
+        mocker.patch(
+            "craft_parts.packages.snaps.check_output",
+            functools.partial(self._side_effect, original_check_output),
+        )
+
+    def _side_effect(self, original, cmd, *args, **kwargs):
+        if self._is_snap_command(cmd):
+            self.calls.append(cmd)
+            return self._fake_snap_command(cmd, *args, **kwargs)
+
+        return original(cmd, *args, **kwargs)
 
     def login(self, email):
         self._email = email
 
     def _get_snap_cmd(self, cmd) -> Tuple[str, List[str]]:
-        try:
-            snap_cmd_index = cmd.index("snap")
-        except ValueError:
+        if "snap" not in cmd:
             return "", []
 
-        try:
-            return cmd[snap_cmd_index + 1], cmd[snap_cmd_index + 2 :]
-        except IndexError:
+        snap_cmd_index = cmd.index("snap") + 1
+        if snap_cmd_index >= len(cmd):
             return "", []
 
+        return cmd[snap_cmd_index], cmd[snap_cmd_index + 1 :]
+
     def _is_snap_command(self, cmd):
         snap_cmd, _ = self._get_snap_cmd(cmd)
         return snap_cmd in ["install", "refresh", "whoami", "download"]
@@ -14,6 +14,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import shlex
 import textwrap
 from typing import List
 
@@ -66,14 +67,32 @@ _parts_yaml = textwrap.dedent(
     """
 )
 
+# LifecycleManager copies the parts data, so it can be shared between tests.
+_parts = yaml.safe_load(_parts_yaml)
 
-@pytest.mark.parametrize("step", list(Step))
+_all_steps = list(Step)
+
+
+@pytest.fixture
+def fake_scriptlet_runner(mocker):
+    """Run echo scriptlets in-process instead of spawning a shell."""
+
+    def run_scriptlet(self, scriptlet, *, scriptlet_name, workdir):
+        # The scriptlets in these tests are single echo commands.
+        print(" ".join(shlex.split(scriptlet)[1:]))
+
+    mocker.patch(
+        "craft_parts.executor.step_handler.StepHandler.run_scriptlet", run_scriptlet
+    )
+
+
+# This test runs the real scriptlets to exercise the shell execution path.
+@pytest.mark.parametrize("step", _all_steps)
 def test_step_callback(tmpdir, capfd, step):
     callbacks.register_pre_step(_step_callback, step_list=[step])
 
-    parts = yaml.safe_load(_parts_yaml)
     lf = craft_parts.LifecycleManager(
-        parts, application_name="test_step_callback", work_dir=tmpdir
+        _parts, application_name="test_step_callback", work_dir=tmpdir
     )
 
     with lf.action_executor() as ctx:
@@ -90,18 +109,18 @@ def test_step_callback(tmpdir, capfd, step):
     )
 
 
-def test_prologue_callback(tmpdir, capfd):
+@pytest.mark.usefixtures("fake_scriptlet_runner")
+def test_prologue_callback(tmpdir, capsys):
     callbacks.register_prologue(_exec_callback)
 
-    parts = yaml.safe_load(_parts_yaml)
     lf = craft_parts.LifecycleManager(
-        parts, application_name="test_prologue_callback", work_dir=tmpdir
+        _parts, application_name="test_prologue_callback", work_dir=tmpdir
     )
 
     with lf.action_executor() as ctx:
         ctx.execute(Action("foo", Step.PULL))
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert not err
     assert out == (
         "application_name = test_prologue_callback\n"
@@ -117,23 +136,28 @@ def _my_step_callback(info: StepInfo) -> bool:
 
 
 # Test the update action separately because it's only defined
-# for steps PULL and BUILD.
-
-
-@pytest.mark.parametrize("step", list(Step))
-@pytest.mark.parametrize("action_type", list(set(ActionType) - {ActionType.UPDATE}))
-def test_callback_pre(tmpdir, capfd, step, action_type):
+# for steps PULL and BUILD. Skipped actions don't run anything regardless
+# of the step, so a single step is enough to verify them.
+_run_action_types = [ActionType.RUN, ActionType.RERUN]
+_callback_cases = [
+    *((step, action_type) for step in _all_steps for action_type in _run_action_types),
+    (Step.PULL, ActionType.SKIP),
+]
+
+
+@pytest.mark.parametrize("step,action_type", _callback_cases)
+@pytest.mark.usefixtures("fake_scriptlet_runner")
+def test_callback_pre(tmpdir, capsys, step, action_type):
     callbacks.register_pre_step(_my_step_callback, step_list=[step])
 
-    parts = yaml.safe_load(_parts_yaml)
     lf = craft_parts.LifecycleManager(
-        parts, application_name="test_callback", work_dir=tmpdir, message="callback"
+        _parts, application_name="test_callback", work_dir=tmpdir, message="callback"
     )
 
     with lf.action_executor() as ctx:
         ctx.execute(Action("foo", step, action_type=action_type))
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert not err
     if action_type == ActionType.SKIP:
         assert not out
@@ -141,20 +165,19 @@ def test_callback_pre(tmpdir, capfd, step, action_type):
         assert out == f"callback\noverride {step!r}\n"
 
 
-@pytest.mark.parametrize("step", list(Step))
-@pytest.mark.parametrize("action_type", list(set(ActionType) - {ActionType.UPDATE}))
-def test_callback_post(tmpdir, capfd, step, action_type):
+@pytest.mark.parametrize("step,action_type", _callback_cases)
+@pytest.mark.usefixtures("fake_scriptlet_runner")
+def test_callback_post(tmpdir, capsys, step, action_type):
     callbacks.register_post_step(_my_step_callback, step_list=[step])
 
-    parts = yaml.safe_load(_parts_yaml)
     lf = craft_parts.LifecycleManager(
-        parts, application_name="test_callback", work_dir=tmpdir, message="callback"
+        _parts, application_name="test_callback", work_dir=tmpdir, message="callback"
     )
 
     with lf.action_executor() as ctx:
         ctx.execute(Action("foo", step, action_type=action_type))
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert not err
     if action_type == ActionType.SKIP:
         assert not out
@@ -162,61 +185,70 @@ def test_callback_post(tmpdir, capfd, step, action_type):
         assert out == f"override {step!r}\ncallback\n"
 
 
-_update_yaml = textwrap.dedent(
-    """\
-    parts:
-      foo:
-        plugin: nil
-        source: .
-        override-pull: echo "override Step.PULL"
-        override-build: echo "override Step.BUILD"
-        override-stage: echo "override Step.STAGE"
-        override-prime: echo "override Step.PRIME"
-    """
-)
+# The same part with a source, so that pull and build can be updated.
+_update_parts = {"parts": {"foo": {**_parts["parts"]["foo"], "source": "."}}}
 
+_update_steps = [Step.PULL, Step.BUILD]
+_non_update_steps = [Step.STAGE, Step.PRIME]
 
-@pytest.mark.parametrize("step", [Step.PULL, Step.BUILD])
-def test_update_callback_pre(tmpdir, capfd, step):
-    callbacks.register_pre_step(_my_step_callback, step_list=[step])
 
-    parts = yaml.safe_load(_update_yaml)
+@pytest.mark.usefixtures("fake_scriptlet_runner")
+def test_update_callback_pre(tmpdir, capsys):
+    callbacks.register_pre_step(_my_step_callback, step_list=_update_steps)
+
     lf = craft_parts.LifecycleManager(
-        parts, application_name="test_callback", work_dir=tmpdir, message="callback"
+        _update_parts,
+        application_name="test_callback",
+        work_dir=tmpdir,
+        message="callback",
     )
 
     with lf.action_executor() as ctx:
-        ctx.execute(Action("foo", step, action_type=ActionType.UPDATE))
-
-    out, err = capfd.readouterr()
+        ctx.execute(
+            [
+                Action("foo", step, action_type=ActionType.UPDATE)
+                for step in _update_steps
+            ]
+        )
+
+    out, err = capsys.readouterr()
     assert not err
-    assert out == f"callback\noverride {step!r}\n"
+    assert out == "".join(f"callback\noverride {step!r}\n" for step in _update_steps)
 
 
-@pytest.mark.parametrize("step", [Step.PULL, Step.BUILD])
-def test_update_callback_post(tmpdir, capfd, step):
-    callbacks.register_post_step(_my_step_callback, step_list=[step])
+@pytest.mark.usefixtures("fake_scriptlet_runner")
+def test_update_callback_post(tmpdir, capsys):
+    callbacks.register_post_step(_my_step_callback, step_list=_update_steps)
 
-    parts = yaml.safe_load(_update_yaml)
     lf = craft_parts.LifecycleManager(
-        parts, application_name="test_callback", work_dir=tmpdir, message="callback"
+        _update_parts,
+        application_name="test_callback",
+        work_dir=tmpdir,
+        message="callback",
     )
 
     with lf.action_executor() as ctx:
-        ctx.execute(Action("foo", step, action_type=ActionType.UPDATE))
-
-    out, err = capfd.readouterr()
+        ctx.execute(
+            [
+                Action("foo", step, action_type=ActionType.UPDATE)
+                for step in _update_steps
+            ]
+        )
+
+    out, err = capsys.readouterr()
     assert not err
-    assert out == f"override {step!r}\ncallback\n"
+    assert out == "".join(f"override {step!r}\ncallback\n" for step in _update_steps)
 
 
-@pytest.mark.parametrize("step", [Step.STAGE, Step.PRIME])
+@pytest.mark.parametrize("step", _non_update_steps)
 def test_invalid_update_callback_pre(tmpdir, step):
     callbacks.register_pre_step(_my_step_callback, step_list=[step])
 
-    parts = yaml.safe_load(_update_yaml)
     lf = craft_parts.LifecycleManager(
-        parts, application_name="test_callback", work_dir=tmpdir, message="callback"
+        _update_parts,
+        application_name="test_callback",
+        work_dir=tmpdir,
+        message="callback",
     )
 
     with lf.action_executor() as ctx, pytest.raises(errors.InvalidAction) as raised:
@@ -228,13 +260,15 @@ def test_invalid_update_callback_pre(tmpdir, step):
     )
 
 
-@pytest.mark.parametrize("step", [Step.STAGE, Step.PRIME])
+@pytest.mark.parametrize("step", _non_update_steps)
 def test_invalid_update_callback_post(tmpdir, step):
     callbacks.register_post_step(_my_step_callback, step_list=[step])
 
-    parts = yaml.safe_load(_update_yaml)
     lf = craft_parts.LifecycleManager(
-        parts, application_name="test_callback", work_dir=tmpdir, message="callback"
+        _update_parts,
+        application_name="test_callback",
+        work_dir=tmpdir,
+        message="callback",
     )
 
     with lf.action_executor() as ctx, pytest.raises(errors.InvalidAction) as raised:
@@ -269,34 +303,42 @@ _exec_yaml = textwrap.dedent(
     """
 )
 
+_exec_parts = yaml.safe_load(_exec_yaml)
+
 
-def test_callback_prologue(tmpdir, capfd):
+@pytest.mark.usefixtures("fake_scriptlet_runner")
+def test_callback_prologue(tmpdir, capsys):
     callbacks.register_prologue(_my_exec_callback)
 
-    parts = yaml.safe_load(_exec_yaml)
     lf = craft_parts.LifecycleManager(
-        parts, application_name="test_callback", work_dir=tmpdir, message="prologue"
+        _exec_parts,
+        application_name="test_callback",
+        work_dir=tmpdir,
+        message="prologue",
     )
 
     with lf.action_executor() as ctx:
         ctx.execute(Action("foo", Step.PULL))
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert not err
     assert out == "foo: prologue\nbar: prologue\nfoo Step.PULL\n"
 
 
-def test_callback_epilogue(tmpdir, capfd):
+@pytest.mark.usefixtures("fake_scriptlet_runner")
+def test_callback_epilogue(tmpdir, capsys):
     callbacks.register_epilogue(_my_exec_callback)
 
-    parts = yaml.safe_load(_exec_yaml)
     lf = craft_parts.LifecycleManager(
-        parts, application_name="test_callback", work_dir=tmpdir, message="epilogue"
+        _exec_parts,
+        application_name="test_callback",
+        work_dir=tmpdir,
+        message="epilogue",
     )
 
     with lf.action_executor() as ctx:
         ctx.execute(Action("foo", Step.PULL))
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert not err
     assert out == "foo Step.PULL\nfoo: epilogue\nbar: epilogue\n"
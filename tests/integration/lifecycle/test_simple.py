@@ -17,10 +17,9 @@
 import textwrap
 from pathlib import Path
 
-import yaml
-
 import craft_parts
 from craft_parts import Action, ActionType, Step
+from craft_parts.utils import yaml_utils
 
 # See https://gist.github.com/sergiusens/dcae19c301eb59e091f92ab29d7d03fc
 
@@ -41,7 +40,7 @@ parts_yaml = textwrap.dedent(
 
 
 def test_actions_simple(new_dir, mocker):
-    parts = yaml.safe_load(parts_yaml)
+    parts = yaml_utils.safe_load(parts_yaml)
 
     Path("a.tar.gz").touch()
     mocker.patch("craft_parts.sources.tar.Tar.provision")  # don't try to untar the file
@@ -60,7 +59,7 @@ def test_actions_simple(new_dir, mocker):
 
     # foobar part depends on nothing
     # command: prime foobar
-    lf = craft_parts.LifecycleManager(parts, application_name="test_demo")
+    lf.reload_state()
     actions = lf.plan(Step.PRIME, ["foobar"])
     assert actions == [
         Action("foobar", Step.PULL, action_type=ActionType.SKIP, reason="already ran"),
@@ -73,7 +72,7 @@ def test_actions_simple(new_dir, mocker):
 
     # Then running build for bar that depends on foo
     # command: build bar
-    lf = craft_parts.LifecycleManager(parts, application_name="test_demo")
+    lf.reload_state()
     actions = lf.plan(Step.BUILD, ["bar"])
     assert actions == [
         Action("bar", Step.PULL, action_type=ActionType.SKIP, reason="already ran"),
@@ -86,7 +85,7 @@ def test_actions_simple(new_dir, mocker):
         ctx.execute(actions)
 
     # Building bar again rebuilds it (explicit request)
-    lf = craft_parts.LifecycleManager(parts, application_name="test_demo")
+    lf.reload_state()
     actions = lf.plan(Step.BUILD, ["bar"])
     assert actions == [
         Action("bar", Step.PULL, action_type=ActionType.SKIP, reason="already ran"),
@@ -99,7 +98,7 @@ def test_actions_simple(new_dir, mocker):
 
     # Modifying foo’s source marks bar as dirty
     new_yaml = parts_yaml.replace("source: a.tar.gz", "source: .")
-    parts = yaml.safe_load(new_yaml)
+    parts = yaml_utils.safe_load(new_yaml)
 
     lf = craft_parts.LifecycleManager(parts, application_name="test_demo")
     actions = lf.plan(Step.BUILD, ["bar"])
@@ -116,7 +115,7 @@ def test_actions_simple(new_dir, mocker):
         ctx.execute(actions)
 
     # A request to build all parts skips everything
-    lf = craft_parts.LifecycleManager(parts, application_name="test_demo")
+    lf.reload_state()
     actions = lf.plan(Step.BUILD)
     assert actions == [
         Action("foo", Step.PULL, action_type=ActionType.SKIP, reason="already ran"),
@@ -129,7 +128,7 @@ def test_actions_simple(new_dir, mocker):
 
     # Touching a source file triggers an update
     Path("a.tar.gz").touch()
-    lf = craft_parts.LifecycleManager(parts, application_name="test_demo")
+    lf.reload_state()
     actions = lf.plan(Step.BUILD)
     assert actions == [
         # fmt: off
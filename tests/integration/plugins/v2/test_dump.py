@@ -14,6 +14,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
 import textwrap
 from pathlib import Path
 
@@ -22,18 +23,18 @@ import yaml
 import craft_parts
 from craft_parts import Action, Step
 
+_parts_yaml = textwrap.dedent(
+    """\
+    parts:
+      foo:
+        plugin: dump
+        source: {source}
+    """
+)
 
-def test_dump_source(tmpdir):
-    _parts_yaml = textwrap.dedent(
-        f"""\
-        parts:
-          foo:
-            plugin: dump
-            source: {tmpdir}/subdir
-        """
-    )
 
-    parts = yaml.safe_load(_parts_yaml)
+def test_dump_source(tmpdir):
+    parts = yaml.safe_load(_parts_yaml.format(source=f"{tmpdir}/subdir"))
     source_dir = Path(tmpdir / "subdir")
     source_dir.mkdir(mode=0o755)
     Path(source_dir / "foobar.txt").touch()
@@ -48,20 +49,11 @@ def test_dump_source(tmpdir):
     install_dir = Path(tmpdir / "parts" / "foo" / "install")
 
     # only the file in subdir should be installed
-    assert list(install_dir.rglob("*")) == [install_dir / "foobar.txt"]
+    assert os.listdir(install_dir) == ["foobar.txt"]
 
 
 def test_dump_ignore(tmpdir):
-    _parts_yaml = textwrap.dedent(
-        f"""\
-        parts:
-          foo:
-            plugin: dump
-            source: {tmpdir}
-        """
-    )
-
-    parts = yaml.safe_load(_parts_yaml)
+    parts = yaml.safe_load(_parts_yaml.format(source=f"{tmpdir}"))
     Path(tmpdir / "foobar.txt").touch()
     lf = craft_parts.LifecycleManager(
         parts, application_name="test_dump", work_dir=tmpdir
@@ -74,4 +66,4 @@ def test_dump_ignore(tmpdir):
     install_dir = Path(tmpdir / "parts" / "foo" / "install")
 
     # craft-parts subdirectories should be ignored
-    assert list(install_dir.rglob("*")) == [install_dir / "foobar.txt"]
+    assert os.listdir(install_dir) == ["foobar.txt"]
@@ -18,10 +18,9 @@ import shutil
 import textwrap
 from pathlib import Path
 
-import yaml
-
 import craft_parts
 from craft_parts import Action, Step
+from craft_parts.utils import yaml_utils
 
 _LOCAL_DIR = Path(__file__).parent
 
@@ -36,10 +35,10 @@ def test_source_tar(tmpdir):
         """
     )
 
-    parts = yaml.safe_load(_parts_yaml)
+    parts = yaml_utils.safe_load(_parts_yaml)
     src = _LOCAL_DIR / "data" / "foobar.tar.gz"
     dest = Path(tmpdir) / "foobar.tar.gz"
-    shutil.copyfile(src, dest)
+    shutil.copy(src, dest)
     lf = craft_parts.LifecycleManager(
         parts, application_name="test_tar", work_dir=tmpdir
     )
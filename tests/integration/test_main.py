@@ -72,13 +72,13 @@ def setup_new_dir(new_dir):  # pylint: disable=unused-argument
     pass
 
 
-def test_main_no_args(mocker, capfd):
+def test_main_no_args(mocker, capsys):
     Path("parts.yaml").write_text(parts_yaml)
 
     mocker.patch.object(sys, "argv", ["cmd"])
     main.main()
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
     assert out == execute_result[3]
     assert Path("parts").is_dir()
@@ -88,18 +88,18 @@ def test_main_no_args(mocker, capfd):
     assert Path("prime").is_dir()
 
 
-def test_main_missing_parts_file(mocker, capfd):
+def test_main_missing_parts_file(mocker, capsys):
     mocker.patch.object(sys, "argv", ["cmd"])
     with pytest.raises(SystemExit) as raised:
         main.main()
     assert raised.value.code == 1
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == "Error: No such file or directory.\n"
     assert out == ""
 
 
-def test_main_unreadable_parts_file(mocker, capfd):
+def test_main_unreadable_parts_file(mocker, capsys):
     Path("parts.yaml").touch()
     Path("parts.yaml").chmod(0o111)
 
@@ -108,12 +108,12 @@ def test_main_unreadable_parts_file(mocker, capfd):
         main.main()
     assert raised.value.code == 1
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == "Error: Permission denied.\n"
     assert out == ""
 
 
-def test_main_invalid_parts_file(mocker, capfd):
+def test_main_invalid_parts_file(mocker, capsys):
     Path("parts.yaml").write_text("not yaml data")
 
     mocker.patch.object(sys, "argv", ["cmd"])
@@ -121,23 +121,23 @@ def test_main_invalid_parts_file(mocker, capfd):
         main.main()
     assert raised.value.code == 2
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == "Error: invalid parts specification.\n"
     assert out == ""
 
 
-def test_main_version(mocker, capfd):
+def test_main_version(mocker, capsys):
     mocker.patch.object(sys, "argv", ["cmd", "--version"])
     with pytest.raises(SystemExit) as raised:
         main.main()
     assert raised.value.code is None
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
     assert out == f"craft-parts {craft_parts.__version__}\n"
 
 
-def test_main_plan_only(mocker, capfd):
+def test_main_plan_only(mocker, capsys):
     Path("parts.yaml").write_text(parts_yaml)
 
     mocker.patch.object(sys, "argv", ["cmd", "--plan-only"])
@@ -145,7 +145,7 @@ def test_main_plan_only(mocker, capfd):
         main.main()
     assert raised.value.code is None
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
     assert out == plan_result[3]
     assert Path("parts").is_dir() is False
@@ -153,14 +153,14 @@ def test_main_plan_only(mocker, capfd):
     assert Path("prime").is_dir() is False
 
 
-def test_main_alternative_work_dir(mocker, capfd):
+def test_main_alternative_work_dir(mocker, capsys):
     Path("parts.yaml").write_text(parts_yaml)
     Path("work_dir").mkdir()
 
     mocker.patch.object(sys, "argv", ["cmd", "--work-dir", "work_dir"])
     main.main()
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
     assert out == execute_result[3]
 
@@ -174,7 +174,7 @@ def test_main_alternative_work_dir(mocker, capfd):
 
 
 @pytest.mark.parametrize("opt", ["--f", "--file"])
-def test_main_alternative_parts_file(mocker, capfd, opt):
+def test_main_alternative_parts_file(mocker, capsys, opt):
     Path("other.yaml").write_text(parts_yaml)
 
     mocker.patch.object(sys, "argv", ["cmd", "--plan-only", opt, "other.yaml"])
@@ -182,12 +182,12 @@ def test_main_alternative_parts_file(mocker, capfd, opt):
         main.main()
     assert raised.value.code is None
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
     assert out == plan_result[3]
 
 
-def test_main_update(mocker, capfd):
+def test_main_update(mocker, capsys):
     Path("parts.yaml").write_text(parts_yaml)
 
     mock_update = mocker.patch("craft_parts.packages.apt_cache.AptCache.update")
@@ -197,7 +197,7 @@ def test_main_update(mocker, capfd):
         main.main()
     assert raised.value.code is None
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
     assert out == plan_result[3]
 
@@ -213,13 +213,13 @@ def test_main_update(mocker, capfd):
         ("prime", execute_result[3]),
     ],
 )
-def test_main_step(mocker, capfd, step, result):
+def test_main_step(mocker, capsys, step, result):
     Path("parts.yaml").write_text(parts_yaml)
 
     mocker.patch.object(sys, "argv", ["cmd", step])
     main.main()
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
     assert out == result
     assert Path("parts").is_dir()
@@ -234,7 +234,7 @@ def test_main_step(mocker, capfd, step, result):
         ("prime", plan_result[3]),
     ],
 )
-def test_main_step_plan_only(mocker, capfd, step, result):
+def test_main_step_plan_only(mocker, capsys, step, result):
     Path("parts.yaml").write_text(parts_yaml)
 
     mocker.patch.object(sys, "argv", ["cmd", "--plan-only", step])
@@ -242,20 +242,20 @@ def test_main_step_plan_only(mocker, capfd, step, result):
         main.main()
     assert raised.value.code is None
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
     assert out == result
     assert Path("parts").is_dir() is False
 
 
-def test_main_step_plan_only_skip(mocker, capfd):
+def test_main_step_plan_only_skip(mocker, capsys):
     Path("parts.yaml").write_text(parts_yaml)
 
     # run it once to build state
     mocker.patch.object(sys, "argv", ["cmd"])
     main.main()
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
 
     # run it again on the existing state
@@ -264,19 +264,19 @@ def test_main_step_plan_only_skip(mocker, capfd):
         main.main()
     assert raised.value.code is None
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
     assert out == "No actions to execute.\n"
 
 
-def test_main_step_plan_only_show_skip(mocker, capfd):
+def test_main_step_plan_only_show_skip(mocker, capsys):
     Path("parts.yaml").write_text(parts_yaml)
 
     # run it once to build state
     mocker.patch.object(sys, "argv", ["cmd"])
     main.main()
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
 
     # run it again on the existing state
@@ -285,18 +285,18 @@ def test_main_step_plan_only_show_skip(mocker, capfd):
         main.main()
     assert raised.value.code is None
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
     assert out == skip_result[3]
 
 
-def test_main_step_specify_part(mocker, capfd):
+def test_main_step_specify_part(mocker, capsys):
     Path("parts.yaml").write_text(parts_yaml)
 
     mocker.patch.object(sys, "argv", ["cmd", "prime", "foo"])
     main.main()
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
     assert (
         out
@@ -304,7 +304,7 @@ def test_main_step_specify_part(mocker, capfd):
     )
 
 
-def test_main_step_specify_part_plan_only(mocker, capfd):
+def test_main_step_specify_part_plan_only(mocker, capsys):
     Path("parts.yaml").write_text(parts_yaml)
 
     mocker.patch.object(sys, "argv", ["cmd", "--plan-only", "prime", "foo"])
@@ -312,7 +312,7 @@ def test_main_step_specify_part_plan_only(mocker, capfd):
         main.main()
     assert raised.value.code is None
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
     assert out == "Pull foo\nBuild foo\nStage foo\nPrime foo\n"
 
@@ -339,7 +339,7 @@ def test_main_step_specify_part_plan_only(mocker, capfd):
         ("prime", plan_result[3]),
     ],
 )
-def test_main_step_specify_multiple_parts(mocker, capfd, step, result):
+def test_main_step_specify_multiple_parts(mocker, capsys, step, result):
     Path("parts.yaml").write_text(parts_yaml)
 
     mocker.patch.object(sys, "argv", ["cmd", "--plan-only", step, "foo", "bar"])
@@ -347,13 +347,13 @@ def test_main_step_specify_multiple_parts(mocker, capfd, step, result):
         main.main()
     assert raised.value.code is None
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
     assert out == result
     assert Path("parts").is_dir() is False
 
 
-def test_main_step_invalid_part(mocker, capfd):
+def test_main_step_invalid_part(mocker, capsys):
     Path("parts.yaml").write_text(parts_yaml)
 
     mocker.patch.object(sys, "argv", ["cmd", "pull", "invalid"])
@@ -361,12 +361,12 @@ def test_main_step_invalid_part(mocker, capfd):
         main.main()
     assert raised.value.code == 3
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == "Error: A part named 'invalid' is not defined in the parts list.\n"
     assert out == ""
 
 
-def test_main_step_invalid_multiple_parts(mocker, capfd):
+def test_main_step_invalid_multiple_parts(mocker, capsys):
     Path("parts.yaml").write_text(parts_yaml)
 
     mocker.patch.object(sys, "argv", ["cmd", "pull", "foo", "invalid"])
@@ -374,13 +374,13 @@ def test_main_step_invalid_multiple_parts(mocker, capfd):
         main.main()
     assert raised.value.code == 3
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == "Error: A part named 'invalid' is not defined in the parts list.\n"
     assert out == ""
     assert Path("parts").is_dir() is False
 
 
-def test_main_step_invalid_part_plan_only(mocker, capfd):
+def test_main_step_invalid_part_plan_only(mocker, capsys):
     Path("parts.yaml").write_text(parts_yaml)
 
     mocker.patch.object(sys, "argv", ["cmd", "--plan-only", "pull", "invalid"])
@@ -388,13 +388,13 @@ def test_main_step_invalid_part_plan_only(mocker, capfd):
         main.main()
     assert raised.value.code == 3
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == "Error: A part named 'invalid' is not defined in the parts list.\n"
     assert out == ""
     assert Path("parts").is_dir() is False
 
 
-def test_main_step_invalid_multiple_parts_plan_only(mocker, capfd):
+def test_main_step_invalid_multiple_parts_plan_only(mocker, capsys):
     Path("parts.yaml").write_text(parts_yaml)
 
     mocker.patch.object(sys, "argv", ["cmd", "--plan-only", "pull", "foo", "invalid"])
@@ -402,20 +402,20 @@ def test_main_step_invalid_multiple_parts_plan_only(mocker, capfd):
         main.main()
     assert raised.value.code == 3
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == "Error: A part named 'invalid' is not defined in the parts list.\n"
     assert out == ""
     assert Path("parts").is_dir() is False
 
 
-def test_main_clean(mocker, capfd):
+def test_main_clean(mocker, capsys):
     Path("parts.yaml").write_text(parts_yaml)
 
     # run it once to build state
     mocker.patch.object(sys, "argv", ["cmd"])
     main.main()
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
     assert Path("parts").is_dir()
     assert Path("stage").is_dir()
@@ -427,7 +427,7 @@ def test_main_clean(mocker, capfd):
         main.main()
     assert raised.value.code is None
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
     assert out == "Clean all parts.\n"
     assert Path("parts").is_dir() is False
@@ -443,7 +443,7 @@ def test_main_clean(mocker, capfd):
     assert out == "Clean all parts.\n"
 
 
-def test_main_clean_workdir(mocker, capfd):
+def test_main_clean_workdir(mocker, capsys):
     Path("parts.yaml").write_text(parts_yaml)
     Path("work_dir").mkdir()
 
@@ -451,7 +451,7 @@ def test_main_clean_workdir(mocker, capfd):
     mocker.patch.object(sys, "argv", ["cmd", "--work-dir", "work_dir"])
     main.main()
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
     assert Path("work_dir/parts").is_dir()
     assert Path("work_dir/stage").is_dir()
@@ -465,7 +465,7 @@ def test_main_clean_workdir(mocker, capfd):
         main.main()
     assert raised.value.code is None
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
     assert out == "Clean all parts.\n"
     assert Path("work_dir/parts").is_dir() is False
@@ -475,7 +475,7 @@ def test_main_clean_workdir(mocker, capfd):
     assert sorted(os.listdir(".")) == ["parts.yaml", "work_dir"]
 
 
-def test_main_clean_plan_only(mocker, capfd):
+def test_main_clean_plan_only(mocker, capsys):
     Path("parts.yaml").write_text(parts_yaml)
 
     mocker.patch.object(sys, "argv", ["cmd", "--plan-only", "clean"])
@@ -483,19 +483,19 @@ def test_main_clean_plan_only(mocker, capfd):
         main.main()
     assert raised.value.code == 4
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == "Error: Clean operations cannot be planned.\n"
     assert out == ""
 
 
-def test_main_clean_part(mocker, capfd):
+def test_main_clean_part(mocker, capsys):
     Path("parts.yaml").write_text(parts_yaml)
 
     # run it once to build state
     mocker.patch.object(sys, "argv", ["cmd"])
     main.main()
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
     assert Path("parts").is_dir()
     assert Path("stage").is_dir()
@@ -507,7 +507,7 @@ def test_main_clean_part(mocker, capfd):
         main.main()
     assert raised.value.code is None
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
     assert out == ""
     assert Path("parts/foo/state/pull").is_file() is False
@@ -530,14 +530,14 @@ def test_main_clean_part(mocker, capfd):
     assert out == ""
 
 
-def test_main_clean_multiple_part(mocker, capfd):
+def test_main_clean_multiple_part(mocker, capsys):
     Path("parts.yaml").write_text(parts_yaml)
 
     # run it once to build state
     mocker.patch.object(sys, "argv", ["cmd"])
     main.main()
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
     assert Path("parts").is_dir()
     assert Path("stage").is_dir()
@@ -549,7 +549,7 @@ def test_main_clean_multiple_part(mocker, capfd):
         main.main()
     assert raised.value.code is None
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == ""
     assert out == ""
     assert Path("parts/foo/state/pull").is_file() is False
@@ -562,7 +562,7 @@ def test_main_clean_multiple_part(mocker, capfd):
     assert Path("parts/bar/state/prime").is_file() is False
 
 
-def test_main_clean_invalid_part(mocker, capfd):
+def test_main_clean_invalid_part(mocker, capsys):
     Path("parts.yaml").write_text(parts_yaml)
 
     # run it once to build state
@@ -571,12 +571,12 @@ def test_main_clean_invalid_part(mocker, capfd):
         main.main()
     assert raised.value.code == 3
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == "Error: A part named 'invalid' is not defined in the parts list.\n"
     assert out == ""
 
 
-def test_main_clean_invalid_multiple_part(mocker, capfd):
+def test_main_clean_invalid_multiple_part(mocker, capsys):
     Path("parts.yaml").write_text(parts_yaml)
 
     # run it once to build state
@@ -585,16 +585,16 @@ def test_main_clean_invalid_multiple_part(mocker, capfd):
         main.main()
     assert raised.value.code == 3
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert err == "Error: A part named 'invalid' is not defined in the parts list.\n"
     assert out == ""
 
 
-def test_main_import(mocker, capfd):
+def test_main_import(mocker, capsys):
     mocker.patch.object(sys, "argv", ["cmd", "--version"])
     with pytest.raises(SystemExit):
         runpy.run_module("craft_parts", run_name="__main__")
 
-    out, err = capfd.readouterr()
+    out, err = capsys.readouterr()
     assert out == f"craft-parts {craft_parts.__version__}\n"
     assert err == ""
@@ -152,3 +152,18 @@ class TestCollisions:
 
         # a part not built doesn't have the stage file in the installdir.
         check_for_stage_collisions([part_built, part_not_built])
+
+    def test_collisions_same_size_different_contents(self, tmpdir):
+        part_list = []
+        for name, content in [("p1", "foo"), ("p2", "foo"), ("p3", "bar")]:
+            part = Part(name, {}, project_dirs=ProjectDirs(work_dir=tmpdir))
+            part.part_install_dir.mkdir(parents=True)
+            (part.part_install_dir / "file").write_text(content)
+            part_list.append(part)
+
+        with pytest.raises(errors.PartConflictError) as raised:
+            check_for_stage_collisions(part_list)
+
+        assert raised.value.other_part_name == "p1"  # type: ignore
+        assert raised.value.part_name == "p3"  # type: ignore
+        assert raised.value.file_paths == "    file"  # type: ignore
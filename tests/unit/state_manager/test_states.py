@@ -0,0 +1,138 @@
+# -*- Mode:Python; indent-tabs-mode:nil; tab-width:4 -*-
+#
+# Copyright (C) 2021 Canonical Ltd
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from craft_parts.parts import Part
+from craft_parts.state_manager import GlobalState, states
+from craft_parts.steps import Step
+
+
+@pytest.mark.usefixtures("new_dir")
+class TestStateFileEntries:
+    """Verify the mapping of steps to existing state files."""
+
+    def test_state_file_entries(self):
+        p1 = Part("foo", {})
+        Path("parts/foo/state").mkdir(parents=True)
+        Path("parts/foo/state/stage").touch()
+        Path("parts/foo/state/pull").touch()
+        Path("parts/foo/state/other").touch()
+        Path("parts/foo/state/build").mkdir()
+
+        # pylint: disable=protected-access
+        assert states._state_file_entries(p1) == {
+            Step.PULL: str(p1.part_state_dir / "pull"),
+            Step.STAGE: str(p1.part_state_dir / "stage"),
+        }
+
+    def test_state_file_entries_no_state_dir(self):
+        p1 = Part("foo", {})
+        # pylint: disable=protected-access
+        assert states._state_file_entries(p1) == {}
+
+
+@pytest.mark.usefixtures("new_dir")
+class TestLoadStepStates:
+    """Verify loading the states of all steps of a part."""
+
+    def test_load_step_states(self):
+        p1 = Part("foo", {})
+        Path("parts/foo/state").mkdir(parents=True)
+        Path("parts/foo/state/build").write_text("assets: {}\n")
+        Path("parts/foo/state/pull").write_text("assets:\n  foo: bar\n")
+
+        step_states = states.load_step_states(p1)
+
+        assert [(step, state) for step, state, _ in step_states] == [
+            (Step.PULL, states.PullState(assets={"foo": "bar"})),
+            (Step.BUILD, states.BuildState()),
+        ]
+        assert step_states[0][2] == Path("parts/foo/state/pull").stat().st_mtime_ns
+        assert step_states[1][2] == Path("parts/foo/state/build").stat().st_mtime_ns
+
+    def test_load_step_states_no_state(self):
+        p1 = Part("foo", {})
+        assert states.load_step_states(p1) == []
+
+    def test_load_step_states_ignores_other_files(self):
+        p1 = Part("foo", {})
+        Path("parts/foo/state").mkdir(parents=True)
+        Path("parts/foo/state/stage").write_text("files: [a]\n")
+        Path("parts/foo/state/other").write_text("not: [valid")
+
+        step_states = states.load_step_states(p1)
+
+        assert [(step, state) for step, state, _ in step_states] == [
+            (Step.STAGE, states.StageState(files={"a"})),
+        ]
+
+
+@pytest.mark.usefixtures("new_dir")
+class TestStateFileFormat:
+    """Verify state file writing and loading."""
+
+    def test_write_load_state(self):
+        p1 = Part("foo", {})
+        state = states.PullState(
+            part_properties={"source": "foo"},
+            files={"b", "a"},
+            assets={"stage-packages": ["pkg=1"]},
+        )
+        state.write(states.state_file_path(p1, Step.PULL))
+
+        assert states.load_state(p1, Step.PULL) == state
+
+    def test_write_state_json(self):
+        p1 = Part("foo", {})
+        state = states.StageState(files={"b", "a"})
+        state.write(states.state_file_path(p1, Step.STAGE))
+
+        assert Path("parts/foo/state/stage").read_text() == (
+            '{"properties": {}, "project-options": {}, '
+            '"files": ["a", "b"], "directories": []}'
+        )
+
+    def test_load_yaml_state(self):
+        p1 = Part("foo", {})
+        Path("parts/foo/state").mkdir(parents=True)
+        Path("parts/foo/state/stage").write_text("files: !!set\n  a: null\n")
+
+        assert states.load_state(p1, Step.STAGE) == states.StageState(files={"a"})
+
+
+@pytest.mark.usefixtures("new_dir")
+class TestGlobalState:
+    """Verify global state writing and loading."""
+
+    def test_write_load_global_state(self):
+        state = GlobalState({"foo": "bar", "packages": {"b", "a"}})
+        state.write(Path("state/global"))
+
+        assert Path("state/global").read_text() == "foo: bar\npackages:\n- a\n- b\n"
+
+        state_data, timestamp = states.load_global_state(Path("state/global"))
+        mtime = Path("state/global").stat().st_mtime
+        assert state_data == {"foo": "bar", "packages": ["a", "b"]}
+        assert timestamp == datetime.fromtimestamp(mtime)
+        assert GlobalState.unmarshal(state_data) == GlobalState(state_data)
+
+    def test_load_global_state_missing(self):
+        assert states.load_global_state(Path("state/global")) == (None, None)
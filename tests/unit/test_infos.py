@@ -14,6 +14,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import copy
 from pathlib import Path
 
 import pytest
@@ -162,3 +163,57 @@ def test_step_info(new_dir):
     assert x.custom_args == ["custom1", "custom2"]
     assert x.custom1 == "foobar"
     assert x.custom2 == [1, 2]
+
+
+def test_step_info_copy(new_dir):
+    info = ProjectInfo(custom1="foobar", custom2=[1, 2])
+    part = Part("foo", {})
+    part_info = PartInfo(project_info=info, part=part)
+    x = StepInfo(part_info=part_info, step=Step.BUILD)
+
+    y = copy.copy(x)
+    y.step = Step.STAGE
+
+    assert x.step == Step.BUILD
+    assert y.step == Step.STAGE
+    assert y.part_name == "foo"
+    assert y.custom1 == "foobar"
+
+
+def test_project_info_invalid_attribute():
+    info = ProjectInfo(custom1="foobar")
+
+    with pytest.raises(AttributeError):
+        info.custom2  # pylint: disable=pointless-statement
+
+    assert getattr(info, "custom2", None) is None
+
+
+def test_step_info_deepcopy(new_dir):
+    info = ProjectInfo(custom1="foobar", custom2=[1, 2])
+    part = Part("foo", {})
+    part_info = PartInfo(project_info=info, part=part)
+    x = StepInfo(part_info=part_info, step=Step.BUILD)
+
+    y = copy.deepcopy(x)
+
+    assert y.step == Step.BUILD
+    assert y.part_name == "foo"
+    assert y.part_src_dir == new_dir / "parts/foo/src"
+    assert y.arch_triplet == x.arch_triplet
+    assert y.custom1 == "foobar"
+    assert y.custom2 == [1, 2]
+
+    # mutable values are copied
+    assert y.custom2 is not x.custom2
+
+
+def test_step_info_attributes(new_dir):
+    info = ProjectInfo()
+    part = Part("foo", {})
+    part_info = PartInfo(project_info=info, part=part)
+    x = StepInfo(part_info=part_info, step=Step.BUILD)
+
+    # step information attributes are fixed
+    with pytest.raises(AttributeError):
+        x.foo = "bar"
@@ -178,6 +178,16 @@ class TestPartOrdering:
         x = parts.sort_parts([p1, p2, p3])
         assert x == [p3, p2, p1]
 
+    def test_sort_parts_diamond(self):
+        p1 = Part("top", {"after": ["left", "right"]})
+        p2 = Part("left", {"after": ["base"]})
+        p3 = Part("right", {"after": ["base"]})
+        p4 = Part("base", {})
+        p5 = Part("alone", {})
+
+        x = parts.sort_parts([p1, p2, p3, p4, p5])
+        assert x == [p5, p4, p2, p3, p1]
+
     def test_sort_parts_cycle(self):
         p1 = Part("foo", {})
         p2 = Part("bar", {"after": ["baz"]})
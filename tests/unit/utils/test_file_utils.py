@@ -0,0 +1,50 @@
+# -*- Mode:Python; indent-tabs-mode:nil; tab-width:4 -*-
+#
+# Copyright (C) 2021 Canonical Ltd
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import os
+import stat
+
+from craft_parts.utils import file_utils
+
+
+class TestCreateSimilarDirectory:
+    def test_create_similar_directory(self, tmpdir):
+        source = os.path.join(tmpdir, "source")
+        destination = os.path.join(tmpdir, "destination")
+        os.mkdir(source, mode=0o750)
+        os.utime(source, ns=(1_000_000_000, 2_000_000_000))
+
+        file_utils.create_similar_directory(source, destination)
+
+        dest_stat = os.stat(destination)
+        assert stat.S_IMODE(dest_stat.st_mode) == 0o750
+        assert dest_stat.st_mtime_ns == 2_000_000_000
+
+    def test_create_similar_directory_from_symlink(self, tmpdir):
+        target = os.path.join(tmpdir, "target")
+        source = os.path.join(tmpdir, "source")
+        destination = os.path.join(tmpdir, "destination")
+        os.mkdir(target, mode=0o750)
+        os.utime(target, ns=(1_000_000_000, 2_000_000_000))
+        os.symlink("target", source)
+
+        file_utils.create_similar_directory(source, destination)
+
+        # mode and times come from the symlink target
+        dest_stat = os.stat(destination)
+        assert stat.S_IMODE(dest_stat.st_mode) == 0o750
+        assert dest_stat.st_mtime_ns == 2_000_000_000
@@ -0,0 +1,155 @@
+# -*- Mode:Python; indent-tabs-mode:nil; tab-width:4 -*-
+#
+# Copyright (C) 2021 Canonical Ltd
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from craft_parts import errors
+from craft_parts.utils import os_utils
+
+
+@pytest.mark.usefixtures("new_dir")
+class TestOsRelease:
+    """Verify os-release file parsing."""
+
+    def test_os_release(self):
+        os_release_file = Path("os-release")
+        os_release_file.write_text(
+            textwrap.dedent(
+                """\
+                NAME="Ubuntu"
+                VERSION="20.04.2 LTS (Focal Fossa)"
+                ID=ubuntu
+                VERSION_ID="20.04"
+                VERSION_CODENAME=focal
+                """
+            )
+        )
+
+        release = os_utils.OsRelease(os_release_file=str(os_release_file.absolute()))
+        assert release.id() == "ubuntu"
+        assert release.name() == "Ubuntu"
+        assert release.version_id() == "20.04"
+        assert release.version_codename() == "focal"
+
+    def test_os_release_codename_from_version_id(self):
+        os_release_file = Path("os-release")
+        os_release_file.write_text('ID=ubuntu\nVERSION_ID="16.04"\n')
+
+        release = os_utils.OsRelease(os_release_file=str(os_release_file.absolute()))
+        assert release.version_codename() == "xenial"
+
+    def test_os_release_codename_unknown_version_id(self):
+        os_release_file = Path("os-release")
+        os_release_file.write_text('ID=ubuntu\nVERSION_ID="1.0"\n')
+
+        release = os_utils.OsRelease(os_release_file=str(os_release_file.absolute()))
+        with pytest.raises(errors.OsReleaseCodenameError):
+            release.version_codename()
+
+    def test_os_release_missing_file(self):
+        release = os_utils.OsRelease(os_release_file=str(Path("missing").absolute()))
+        with pytest.raises(errors.OsReleaseIdError):
+            release.id()
+
+    def test_os_release_file_read_once(self):
+        os_release_file = Path("os-release")
+        os_release_file.write_text("ID=ubuntu\n")
+        path = str(os_release_file.absolute())
+
+        assert os_utils.OsRelease(os_release_file=path).id() == "ubuntu"
+
+        # the file contents are cached after the first read
+        os_release_file.write_text("ID=debian\n")
+        assert os_utils.OsRelease(os_release_file=path).id() == "ubuntu"
+
+
+@pytest.mark.usefixtures("new_dir")
+class TestSystemPaths:
+    """Verify the listing of existing system paths."""
+
+    def test_get_bin_paths(self):
+        Path("root/usr/bin").mkdir(parents=True)
+        Path("root/bin").symlink_to("usr/bin")
+
+        paths = os_utils.get_bin_paths(root="root")
+        assert paths == ["root/usr/bin", "root/bin"]
+
+    def test_get_bin_paths_not_existing(self):
+        paths = os_utils.get_bin_paths(root="root", existing_only=False)
+        assert paths == ["root/usr/sbin", "root/usr/bin", "root/sbin", "root/bin"]
+
+    def test_get_include_paths(self):
+        Path("root/usr/include/x86_64-linux-gnu").mkdir(parents=True)
+
+        paths = os_utils.get_include_paths(root="root", arch_triplet="x86_64-linux-gnu")
+        assert paths == ["root/usr/include", "root/usr/include/x86_64-linux-gnu"]
+
+    def test_get_library_paths(self):
+        Path("root/usr/lib/x86_64-linux-gnu").mkdir(parents=True)
+        Path("root/lib").symlink_to("usr/lib")
+
+        paths = os_utils.get_library_paths(
+            root=Path("root"), arch_triplet="x86_64-linux-gnu"
+        )
+        assert paths == [
+            "root/lib",
+            "root/usr/lib",
+            "root/lib/x86_64-linux-gnu",
+            "root/usr/lib/x86_64-linux-gnu",
+        ]
+
+    def test_get_library_paths_not_existing(self):
+        paths = os_utils.get_library_paths(
+            root="root", arch_triplet="x86_64-linux-gnu", existing_only=False
+        )
+        assert paths == [
+            "root/lib",
+            "root/usr/lib",
+            "root/lib/x86_64-linux-gnu",
+            "root/usr/lib/x86_64-linux-gnu",
+        ]
+
+    def test_get_pkg_config_paths(self):
+        Path("root/usr/share/pkgconfig").mkdir(parents=True)
+        Path("root/usr/local/lib").mkdir(parents=True)
+        Path("root/usr/local/lib/pkgconfig").touch()
+        Path("root/lib").mkdir()
+        Path("root/lib/pkgconfig").symlink_to("missing")
+
+        paths = os_utils.get_pkg_config_paths(
+            root="root", arch_triplet="x86_64-linux-gnu"
+        )
+        # dangling symlinks are listed, like os.path.lexists does
+        assert paths == [
+            "root/lib/pkgconfig",
+            "root/usr/share/pkgconfig",
+            "root/usr/local/lib/pkgconfig",
+        ]
+
+
+def test_is_dumb_terminal_cached(mocker):
+    os_utils.is_dumb_terminal.cache_clear()
+    isatty = mocker.patch("os.isatty", return_value=True)
+    mocker.patch.dict("os.environ", {"TERM": "xterm"})
+
+    assert os_utils.is_dumb_terminal() is False
+    assert os_utils.is_dumb_terminal() is False
+    assert isatty.call_count == 1
+
+    os_utils.is_dumb_terminal.cache_clear()
@@ -36,3 +36,21 @@ def test_load_yaml_data():
 def test_dump_yaml_data():
     data = {"foo": "bar", "foobar": ["zzz", "aaa"]}
     assert yaml_utils.dump(data) == contents
+
+
+def test_dump_yaml_set():
+    data = {"foo": {"zzz", "aaa"}}
+    assert yaml_utils.dump(data) == "foo:\n- aaa\n- zzz\n"
+
+
+def test_load_yaml_without_libyaml(mocker, caplog):
+    mocker.patch("craft_parts.utils.yaml_utils._HAS_LIBYAML", False)
+    yaml_utils._check_libyaml.cache_clear()
+
+    yaml_utils.load(contents)
+    yaml_utils.safe_load(contents)
+    yaml_utils._check_libyaml.cache_clear()
+
+    assert caplog.messages == [
+        "libyaml bindings not available, YAML loading will be slow"
+    ]